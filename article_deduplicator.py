@@ -0,0 +1,120 @@
+from __future__ import annotations
+from collections import defaultdict
+from dataclasses import dataclass
+from hashlib import blake2b, sha256
+from typing import Dict, List
+from article import Article
+from metrics import METRICS
+import numpy as np
+import re
+
+
+class ArticleDeduplicator:
+    """
+    Drops articles whose content was already seen during a run, also across
+    sources: exact duplicates by a hash of the normalized content, near
+    duplicates (same press release, slightly edited) by MinHash signatures
+    in an LSH band index, so each new article is only compared against the
+    few articles sharing a band with it.
+    """
+
+    @dataclass
+    class Parameters:
+        shingle_size: int = 5  # words
+        permutations: int = 128
+        bands: int = 32  # 4 rows per band, candidates from a Jaccard similarity of ~0.4
+        threshold: float = 0.8  # estimated Jaccard similarity of near duplicates
+        seed: int = 0
+
+    _PRIME: int = (1 << 61) - 1
+    _TOKEN_PATTERN: re.Pattern = re.compile(r"\w+")
+
+    _parameters: Parameters
+    _rows: int
+    _a: np.ndarray
+    _b: np.ndarray
+    _hashes: Dict[str, Article]
+    _signatures: List[np.ndarray]
+    _articles: List[Article]
+    _buckets: List[Dict[bytes, List[int]]]
+
+    def __init__(self, parameters: Parameters | None = None):
+        self._parameters = parameters or self.Parameters()
+        if self._parameters.permutations % self._parameters.bands:
+            raise ValueError("permutations must be a multiple of bands")
+        self._rows = self._parameters.permutations // self._parameters.bands
+
+        # a * x + b stays below 2**64 for 32 bit shingle hashes
+        rng = np.random.default_rng(self._parameters.seed)
+        self._a = rng.integers(1, 1 << 31, self._parameters.permutations, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 31, self._parameters.permutations, dtype=np.uint64)
+
+        self._hashes = {}
+        self._signatures = []
+        self._articles = []
+        self._buckets = [defaultdict(list) for _ in range(self._parameters.bands)]
+
+    def filter(self, articles: List[Article]) -> List[Article]:
+        return [article for article in articles if self.add(article)]
+
+    def add(self, article: Article) -> bool:
+        """Index `article`, returns False if it duplicates an earlier one."""
+        tokens = self._tokens(article)
+        content_hash = sha256(" ".join(tokens).encode()).hexdigest()
+        if content_hash in self._hashes:
+            METRICS.increment("articles_duplicates_total", kind="exact", source=article.source)
+            return False
+
+        signature = self._signature(tokens)
+        keys = self._band_keys(signature)
+        if self._near_duplicate(signature, keys) is not None:
+            METRICS.increment("articles_duplicates_total", kind="near", source=article.source)
+            return False
+
+        index = len(self._articles)
+        self._hashes[content_hash] = article
+        self._articles.append(article)
+        self._signatures.append(signature)
+        for buckets, key in zip(self._buckets, keys):
+            buckets[key].append(index)
+        return True
+
+    def _tokens(self, article: Article) -> List[str]:
+        # Listing only sources may have no content besides the title
+        text = article.content if article.content.strip() else article.title
+        return self._TOKEN_PATTERN.findall(text.lower())
+
+    def _signature(self, tokens: List[str]) -> np.ndarray:
+        size = self._parameters.shingle_size
+        shingles = {
+            " ".join(tokens[i:i + size])
+            for i in range(max(1, len(tokens) - size + 1))
+        }
+        hashes = np.fromiter(
+            (
+                int.from_bytes(blake2b(shingle.encode(), digest_size=4).digest(), "little")
+                for shingle in shingles
+            ),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % np.uint64(self._PRIME)
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[i * self._rows:(i + 1) * self._rows].tobytes()
+            for i in range(self._parameters.bands)
+        ]
+
+    def _near_duplicate(self, signature: np.ndarray, keys: List[bytes]) -> Article | None:
+        candidates = {
+            index
+            for buckets, key in zip(self._buckets, keys)
+            for index in buckets.get(key, ())
+        }
+        for index in candidates:
+            similarity = float(np.mean(self._signatures[index] == signature))
+            if similarity >= self._parameters.threshold:
+                return self._articles[index]
+        return None
@@ -0,0 +1,142 @@
+from __future__ import annotations
+from datetime import datetime
+from hashlib import sha256
+from threading import Lock
+from typing import Dict, List
+from article import Article
+import os
+import sqlite3
+import time
+
+
+class ArticleStore:
+    """Embedded SQLite store of every scraped article."""
+
+    _connection: sqlite3.Connection
+    _lock: Lock
+
+    def __init__(self, filename: str = ".data/articles.sqlite3"):
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(filename, check_same_thread=False, timeout=30.0)
+        # The crawler writes while the app reads
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                source TEXT NOT NULL,
+                link TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                title TEXT NOT NULL,
+                medium_organisation TEXT NOT NULL,
+                content TEXT NOT NULL,
+                scraped_at REAL NOT NULL,
+                PRIMARY KEY (source, link)
+            )
+        """)
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS articles_source_timestamp ON articles (source, timestamp)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS articles_link ON articles (link)"
+        )
+        # Last complete crawl of each source
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS crawls (
+                source TEXT PRIMARY KEY,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                crawled_at REAL NOT NULL
+            )
+        """)
+        self._connection.commit()
+        self._lock = Lock()
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        return sha256(content.encode()).hexdigest()
+
+    def lookup(self, source: str, links: List[str]) -> Dict[str, Article]:
+        if not links:
+            return {}
+        with self._lock:
+            rows = self._connection.execute(
+                f"""
+                SELECT timestamp, title, medium_organisation, content, link
+                FROM articles
+                WHERE source = ? AND link IN ({', '.join('?' * len(links))})
+                """,
+                (source, *links)
+            ).fetchall()
+        return {
+            link: self._to_article(source, timestamp, title, medium_organisation, content, link)
+            for timestamp, title, medium_organisation, content, link in rows
+        }
+
+    def query(self, sources: List[str], start_date: datetime, end_date: datetime) -> List[Article]:
+        """All stored articles of `sources` with `start_date <= timestamp <= end_date`."""
+        if not sources:
+            return []
+        with self._lock:
+            rows = self._connection.execute(
+                f"""
+                SELECT source, timestamp, title, medium_organisation, content, link
+                FROM articles
+                WHERE source IN ({', '.join('?' * len(sources))})
+                    AND timestamp BETWEEN ? AND ?
+                ORDER BY timestamp
+                """,
+                (*sources, start_date.isoformat(), end_date.isoformat())
+            ).fetchall()
+        return [self._to_article(*row) for row in rows]
+
+    def add(self, articles: List[Article]):
+        now = time.time()
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        a.source,
+                        a.link,
+                        self.content_hash(a.content),
+                        a.timestamp.isoformat(),
+                        a.title,
+                        a.medium_organisation,
+                        a.content,
+                        now
+                    )
+                    for a in articles
+                ]
+            )
+            self._connection.commit()
+
+    def record_crawl(self, source: str, start_date: datetime, end_date: datetime):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO crawls VALUES (?, ?, ?, ?)",
+                (source, start_date.isoformat(), end_date.isoformat(), time.time())
+            )
+            self._connection.commit()
+
+    def is_crawled(self, source: str, start_date: datetime, end_date: datetime, max_age: float) -> bool:
+        """Whether a crawl of at most `max_age` seconds ago covered the date range."""
+        with self._lock:
+            row = self._connection.execute(
+                """
+                SELECT 1 FROM crawls
+                WHERE source = ? AND start_date <= ? AND end_date >= ? AND crawled_at >= ?
+                """,
+                (source, start_date.isoformat(), end_date.isoformat(), time.time() - max_age)
+            ).fetchone()
+        return row is not None
+
+    @staticmethod
+    def _to_article(source: str, timestamp: str, title: str, medium_organisation: str, content: str, link: str) -> Article:
+        return Article(
+            timestamp=datetime.fromisoformat(timestamp),
+            title=title,
+            medium_organisation=medium_organisation,
+            content=content,
+            link=link,
+            source=source
+        )
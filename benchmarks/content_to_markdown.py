@@ -0,0 +1,88 @@
+"""
+Micro-benchmark of `Scraper._content_to_markdown` against the previous
+recursive implementation, on synthetic article bodies of growing size.
+
+    python -m benchmarks.content_to_markdown
+"""
+from bs4 import BeautifulSoup
+from scrapers.scraper import Scraper
+from scrapers.bna_scraper import BnaScraper
+import random
+import timeit
+
+
+def recursive_markdown(content) -> str:
+    """The implementation before the iterative rewrite."""
+    text_parts = []
+
+    for child in content.children:
+        if child.name == "a":
+            label = child.get_text(strip=True)
+            href = child.get("href", "")
+            text_parts.append(f"[{label}]({href})")
+
+        elif child.name in ("p", "div", "strong", "span", "abbr"):
+            text_parts.append(recursive_markdown(child).strip() + "\n")
+
+        elif child.name is None:  # NavigableString
+            text_parts.append(child)
+
+        else:
+            text_parts.append(recursive_markdown(child))
+
+    return "".join(text_parts)
+
+
+WORDS = "Bundestag Ausschuss Antwort Regierung Gesetz Entwurf Digitalisierung Verwaltung Daten Schutz".split()
+
+
+def random_html(rng: random.Random, paragraphs: int, depth: int = 3) -> str:
+    def inline(level: int) -> str:
+        parts = []
+        for _ in range(rng.randint(3, 8)):
+            kind = rng.random()
+            if kind < 0.55 or level == 0:
+                parts.append(" ".join(rng.choices(WORDS, k=rng.randint(1, 6))) + rng.choice([" ", "\n", "  "]))
+            elif kind < 0.7:
+                parts.append(f'<a href="/link/{rng.randint(0, 999)}">{rng.choice(WORDS)}</a>')
+            else:
+                tag = rng.choice(["strong", "span", "abbr", "i", "em", "b"])
+                parts.append(f"<{tag}>{inline(level - 1)}</{tag}>")
+        return "".join(parts)
+
+    blocks = []
+    for _ in range(paragraphs):
+        tag = rng.choice(["p", "p", "p", "div"])
+        blocks.append(f"<{tag}>{inline(depth)}</{tag}>\n")
+    return f'<div class="bt-artikel__article">{"".join(blocks)}</div>'
+
+
+def main():
+    scraper = BnaScraper()
+    rng = random.Random(0)
+
+    # The rewrite must not change any output
+    for _ in range(500):
+        soup = BeautifulSoup(random_html(rng, rng.randint(1, 6)), Scraper._PARSER)
+        div = soup.div
+        expected = recursive_markdown(div)
+        assert scraper._content_to_markdown(div) == expected
+        assert scraper._content_to_markdown(div, first_paragraph=True) == expected.strip().split("\n")[0]
+
+    print(f"{'paragraphs':>10} {'recursive':>12} {'iterative':>12} {'first line':>12}")
+    for paragraphs in (5, 50, 500):
+        div = BeautifulSoup(random_html(rng, paragraphs), Scraper._PARSER).div
+        number = max(1, 2_000 // paragraphs)
+        timings = [
+            min(timeit.repeat(function, number=number, repeat=5)) / number
+            for function in (
+                lambda: recursive_markdown(div),
+                lambda: scraper._content_to_markdown(div),
+                lambda: scraper._content_to_markdown(div, first_paragraph=True)
+            )
+        ]
+        print(f"{paragraphs:>10} " + " ".join(f"{t * 1e6:>10.1f}us" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
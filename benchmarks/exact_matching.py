@@ -0,0 +1,83 @@
+"""
+Benchmark of `ExactSubMatcher.match` against the previous substring scan per
+text and keyword, growing the keyword set and the number of texts.
+
+    python -m benchmarks.exact_matching
+"""
+from matching.corpus import Corpus
+from matching.exact_sub_matcher import ExactSubMatcher
+from typing import List
+import json
+import random
+import time
+
+
+def substring_match(keywords: List[str], texts: List[str]) -> List[List[bool]]:
+    """The implementation before the Aho-Corasick automaton."""
+    lower_keywords = [keyword.lower() for keyword in keywords]
+    lower_texts = [text.lower() for text in texts]
+
+    matches = []
+    for lower_text in lower_texts:
+        matches.append([])
+        for lower_keyword in lower_keywords:
+            matches[-1].append(lower_keyword.lower() in lower_text.lower())
+    return matches
+
+
+def load_keywords() -> List[str]:
+    with open("keywords.json", 'r', encoding="utf-8") as file:
+        topics = json.load(file)["topics"]
+    return [keyword for keywords in topics.values() for keyword in keywords]
+
+
+def synthetic_keywords(rng: random.Random, keywords: List[str], count: int) -> List[str]:
+    """The real keywords, padded with German-looking compounds of their parts."""
+    parts = [part for keyword in keywords for part in keyword.split()]
+    result = list(keywords[:count])
+    while len(result) < count:
+        result.append(rng.choice(parts) + rng.choice(parts).lower())
+    return result
+
+
+def random_texts(rng: random.Random, keywords: List[str], count: int, length: int = 2_000) -> List[str]:
+    with open("german_stopwords.json", 'r', encoding="utf-8") as file:
+        words = json.load(file) + ["Bundestag", "Regierung", "Verwaltung", "Gesetzentwurf", "Digitalisierung"]
+    texts = []
+    for _ in range(count):
+        parts = []
+        size = 0
+        while size < length:
+            parts.append(rng.choice(keywords) if rng.random() < 0.01 else rng.choice(words))
+            size += len(parts[-1]) + 1
+        texts.append(" ".join(parts))
+    return texts
+
+
+def main():
+    rng = random.Random(0)
+    keywords = load_keywords()
+    matcher = ExactSubMatcher()
+    parameters = ExactSubMatcher.Parameters()
+
+    print(f"{'keywords':>8} {'texts':>6} {'substring':>10} {'automaton':>10} {'speedup':>8}")
+    for keyword_count in (10, len(keywords), 300):
+        selected = synthetic_keywords(rng, keywords, keyword_count)
+        for text_count in (100, 300, 1_000):
+            texts = random_texts(rng, selected, text_count)
+
+            start = time.perf_counter()
+            expected = substring_match(selected, texts)
+            substring = time.perf_counter() - start
+
+            start = time.perf_counter()
+            result = matcher.match(Corpus(selected), Corpus(texts), parameters)
+            automaton = time.perf_counter() - start
+
+            # The automaton must not change any match
+            assert result.matches == expected
+            print(f"{keyword_count:>8} {text_count:>6} {substring:>9.3f}s {automaton:>9.3f}s {substring / automaton:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
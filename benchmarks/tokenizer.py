@@ -0,0 +1,50 @@
+"""
+Benchmark of `Stemmer.word_tokenize` against the previous character filter,
+on German texts of growing length.
+
+    python -m benchmarks.tokenizer
+"""
+from benchmarks.exact_matching import load_keywords, random_texts
+from string import ascii_lowercase, ascii_uppercase
+from stemmer import Stemmer
+from typing import List
+import random
+import timeit
+
+
+def filter_tokenize(text: str) -> List[str]:
+    """The implementation before the regex tokenizer."""
+    valid_characters = ascii_lowercase + ascii_uppercase + "- "
+    text = "".join(c for c in text if c in valid_characters).lower()
+    return text.split(" ")
+
+
+def main():
+    example = "Bund und Länder einigen sich: Straßenbau-Förderung 2025 (§ 3 BStatG)."
+    print(f"{'':>10} {example}")
+    print(f"{'filter':>10} {filter_tokenize(example)}")
+    print(f"{'regex':>10} {Stemmer.word_tokenize(example)}")
+    print()
+
+    rng = random.Random(0)
+    keywords = load_keywords()
+    print(f"{'chars':>10} {'filter':>12} {'regex':>12} {'offsets':>12} {'speedup':>8}")
+    for length in (1_000, 10_000, 100_000, 1_000_000):
+        text = random_texts(rng, keywords, 1, length)[0]
+        number = max(1, 1_000_000 // length)
+        timings = [
+            min(timeit.repeat(function, number=number, repeat=5)) / number
+            for function in (
+                lambda: filter_tokenize(text),
+                lambda: Stemmer.word_tokenize(text),
+                lambda: Stemmer.word_offsets(text)
+            )
+        ]
+        print(
+            f"{length:>10} " + " ".join(f"{t * 1e3:>10.3f}ms" for t in timings)
+            + f" {timings[0] / timings[1]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from threading import Event
+from typing import Dict, List
+from article_store import ArticleStore
+from metrics import METRICS
+from progress import Progress
+from scrapers.scraper import Scraper
+from scrapers.scrape_engine import ScrapeEngine
+from scrapers.scrapers import ALL_SCRAPERS
+import argparse
+import time as clock
+import traceback
+
+
+HIB_INTERVAL: float = 15 * 60  # s
+METRICS_DIRECTORY: str = ".data/metrics"
+
+
+class Crawler:
+    """
+    Keeps the article store current: scrapes every source on its own
+    schedule and records each complete crawl, so the app can answer queries
+    inside the crawled window from the store without scraping.
+    """
+
+    @dataclass
+    class Parameters:
+        history: int = 30  # days, crawled window before today
+        interval: float = 60 * 60  # s
+        intervals: Dict[str, float] = field(default_factory=dict)  # s, per source
+        max_sources: int = 12
+
+    _scrapers: Dict[str, Scraper]
+    _parameters: Parameters
+    _store: ArticleStore
+    _due: Dict[str, float]
+
+    def __init__(self, scrapers: List[Scraper], store: ArticleStore, parameters: Parameters | None = None):
+        self._scrapers = {scraper.SOURCE: scraper for scraper in scrapers}
+        self._store = store
+        self._parameters = parameters or self.Parameters()
+        self._due = {source: 0.0 for source in self._scrapers}
+
+    def run(self, stop: Event | None = None):
+        stop = stop or Event()
+        while not stop.is_set():
+            now = clock.monotonic()
+            due = [source for source, due_at in self._due.items() if due_at <= now]
+            if due:
+                self.crawl(due)
+                now = clock.monotonic()
+                for source in due:
+                    self._due[source] = now + self._parameters.intervals.get(source, self._parameters.interval)
+            stop.wait(max(0.0, min(self._due.values()) - clock.monotonic()))
+
+    def crawl(self, sources: List[str]):
+        end_date = datetime.combine(datetime.now(), time.min)
+        start_date = end_date - timedelta(days=self._parameters.history)
+        # Only pages missing from the store are fetched
+        parameters = Scraper.Parameters(start_date, end_date, since_last_run=True)
+        progress = Progress()
+        result = ScrapeEngine.Result()
+        scrapers = [self._scrapers[source] for source in sources]
+
+        failures = {
+            source: METRICS.counter("scraper_failed_requests_total", source=source)
+            for source in sources
+        }
+        for _ in ScrapeEngine(self._parameters.max_sources).stream(scrapers, parameters, progress, result):
+            pass
+
+        for source in sources:
+            if source in result.errors:
+                e = result.errors[source]
+                print(f"### Exception while Crawling {source}", flush=True)
+                print("".join(traceback.format_exception(e)), flush=True)
+            elif METRICS.counter("scraper_failed_requests_total", source=source) > failures[source]:
+                print(f"### Incomplete crawl of {source}", flush=True)
+            else:
+                self._store.record_crawl(source, start_date, end_date)
+                print(f"### Crawled {source}", flush=True)
+        for message in progress.error_messages:
+            print(message, flush=True)
+        METRICS.write(METRICS_DIRECTORY, "crawler")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep the article store current")
+    parser.add_argument("--once", action="store_true", help="crawl every source once and exit")
+    parser.add_argument("--history", type=int, default=Crawler.Parameters.history, help="days to crawl")
+    parser.add_argument("--interval", type=float, default=Crawler.Parameters.interval, help="seconds between crawls of a source")
+    parser.add_argument("--parse-processes", type=int, default=None, help="parse pages in this many processes")
+    parser.add_argument("--metrics-port", type=int, default=None, help="serve /metrics and /metrics.json on this port")
+    arguments = parser.parse_args()
+
+    store = Scraper.article_store()
+    if store is None:
+        parser.error("The article store is disabled")
+    # The crawler must see the sources' current state
+    ScrapeEngine.configure_result_cache(None)
+    if arguments.parse_processes is not None:
+        Scraper.configure_parsing(arguments.parse_processes)
+    if arguments.metrics_port is not None:
+        METRICS.serve(arguments.metrics_port)
+
+    crawler = Crawler(
+        list(ALL_SCRAPERS.values()),
+        store,
+        Crawler.Parameters(
+            history=arguments.history,
+            interval=arguments.interval,
+            intervals={"Heute im Bundestag": HIB_INTERVAL}
+        )
+    )
+    if arguments.once:
+        crawler.crawl([scraper.SOURCE for scraper in ALL_SCRAPERS.values()])
+    else:
+        crawler.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,35 @@ from frontend.idle import idle
 from frontend.running import running
 from frontend.done import done
 from progress import Progress
+from metrics import METRICS
+from scrapers.scraper import Scraper
+import os
+
+
+METRICS_PORT: int = 9464
+# One core stays with the app
+PARSE_PROCESSES: int = max(1, (os.cpu_count() or 1) - 1)
+
+
+@st.cache_resource
+def _serve_metrics():
+    # Once per process, the metrics are shared by all sessions
+    try:
+        return METRICS.serve(METRICS_PORT)
+    except OSError as e:
+        print(f"### Metrics endpoint unavailable: {e}", flush=True)
+        return None
+
+
+@st.cache_resource
+def _configure_parsing():
+    Scraper.configure_parsing(PARSE_PROCESSES)
 
 
 def entry():
     st.set_page_config(layout="wide")
+    _serve_metrics()
+    _configure_parsing()
 
     if "state" not in st.session_state:
         st.session_state["state"] = "idle"
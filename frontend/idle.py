@@ -5,14 +5,19 @@ from datetime import datetime, time, timedelta
 from thread import ThreadWithResult
 from scrapers.scrapers import ALL_SCRAPERS
 from scrapers.scraper import Scraper
-from matching.matcher import Matcher, SubMatcherType, ExactSubMatcher, StemSubMatcher, SimilaritySubMatcher 
+from scrapers.scrape_engine import ScrapeEngine
+from matching.matcher import Matcher, StreamingMatcher, SubMatcherType, ExactSubMatcher, StemSubMatcher, SimilaritySubMatcher
 from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from matching.match_filter import MatchFilter
+from article_deduplicator import ArticleDeduplicator
+from stemmer import Stemmer
 import traceback
 
 
 KEYWORDS_FILENAME: str = "keywords.json"
 WEEK: int = 7  # days
+MAX_SCRAPER_WORKERS: int = 12
+CRAWL_MAX_AGE: float = 2 * 60 * 60  # s, see crawler.py
 
 
 @st.cache_data
@@ -33,34 +38,70 @@ def _worker(
     progress = st.session_state["progress"]
 
     selected_scrapers = st.session_state["selected_scrapers"]
-    articles = []
 
-    for scraper in progress.start_iteration(
-        selected_scrapers, 
-        total=len(selected_scrapers), 
-        desc="Running Scrapers"
-    ):
-        try:
-            articles.extend(scraper.scrape(scraper_parameters, progress))
-        except Exception as e:
-            print("### Exception while Scraping", flush=True)
-            print(e, flush=True)
-            print(traceback.format_exc(), flush=True)
-            progress.add_eadd_error_message(f"Fehler beim Scrapen von: {scraper.SOURCE}")
-
-    contents = [a.content for a in articles]
+    store = Scraper.article_store()
+    live_scrapers = selected_scrapers
+    if scraper_parameters.since_last_run and store is not None:
+        # Sources the crawler keeps current are only read from the store
+        live_scrapers = [
+            scraper for scraper in selected_scrapers
+            if not store.is_crawled(
+                scraper.SOURCE,
+                scraper_parameters.start_date,
+                scraper_parameters.end_date,
+                CRAWL_MAX_AGE
+            )
+        ]
+
+    scrape_result = ScrapeEngine.Result()
+    articles = []
     try:
-        matcher_result = Matcher().match(
-            matcher_parameters, 
-            keywords, 
-            contents,
-            progress
-        )
+        matcher = StreamingMatcher(matcher_parameters, keywords)
+        # The same press release is often published by several sources
+        deduplicator = ArticleDeduplicator()
+
+        # Match each micro-batch while the slower sources are still scraping
+        for batch in ScrapeEngine(MAX_SCRAPER_WORKERS).stream(
+            live_scrapers,
+            scraper_parameters,
+            progress,
+            scrape_result
+        ):
+            batch = deduplicator.filter(batch)
+            matcher.add([a.content for a in batch])
+            articles.extend(batch)
+            st.session_state["partial_result"] = MatchFilter.Result(list(articles), matcher.result)
+
+        if store is not None:
+            # Also covers crawled sources and articles the sources have already paged out
+            links = {a.link for a in articles}
+            stored_articles = deduplicator.filter([
+                a for a in store.query(
+                    [scraper.SOURCE for scraper in selected_scrapers],
+                    scraper_parameters.start_date,
+                    scraper_parameters.end_date
+                )
+                if a.link not in links
+            ])
+            matcher.add([a.content for a in stored_articles])
+            articles.extend(stored_articles)
+
+        matcher_result = matcher.finish(progress)
+        try:
+            Stemmer.save_cache()
+        except OSError as e:
+            print(f"### Stem cache not saved: {e}", flush=True)
     except Exception as e:
         print("### Exception while Matching", flush=True)
         print(e, flush=True)
         print(traceback.format_exc(), flush=True)
         return MatchFilter.Result.empty()
+    finally:
+        for source, e in scrape_result.errors.items():
+            print(f"### Exception while Scraping {source}", flush=True)
+            print(e, flush=True)
+            print("".join(traceback.format_exception(e)), flush=True)
+            progress.add_error_message(f"Fehler beim Scrapen von: {source}")
 
     # keywords = st.session_state["keywords"]
     # try:
@@ -85,7 +126,8 @@ def _start_workload(
     selected_scrapers: List[Scraper],
     start_date: datetime,
     end_date: datetime,
-    cosine_threshold: float
+    cosine_threshold: float,
+    since_last_run: bool
 ):
     st.session_state["state"] = "running"
 
@@ -101,7 +143,7 @@ def _start_workload(
     if match_similarity:
         sub_matcher_selection.add(SubMatcherType.SIMILARITY)
 
-    scraper_parameters = Scraper.Parameters(start_date, end_date)
+    scraper_parameters = Scraper.Parameters(start_date, end_date, since_last_run)
     matcher_parameters = Matcher.Parameters(
         sub_matcher_selection,
         ExactSubMatcher.Parameters() if match_exact else None,
@@ -112,6 +154,7 @@ def _start_workload(
     st.session_state["keywords"] = keywords
     st.session_state["matcher_parameters"] = matcher_parameters
     st.session_state["selected_scrapers"] = selected_scrapers
+    st.session_state["partial_result"] = None
 
     thread = ThreadWithResult(target=_worker, args=(scraper_parameters, matcher_parameters, keywords))
     add_script_run_ctx(thread, get_script_run_ctx())
@@ -174,6 +217,11 @@ def idle():
         max_value="today"
     ), time.min)
 
+    since_last_run = st.toggle(
+        label="Bereits abgerufene Artikel wiederverwenden",
+        value=True
+    )
+
     if st.button("Starten", use_container_width=True):
         _start_workload(
             keywords,
@@ -182,7 +230,8 @@ def idle():
             selected_scrapers,
             start_date,
             end_date,
-            cosine_threshold
+            cosine_threshold,
+            since_last_run
         )
 
 
@@ -1,4 +1,5 @@
 import streamlit as st
+import pandas as pd
 from streamlit_autorefresh import st_autorefresh
 
 
@@ -9,11 +10,27 @@ def running():
     progress = st.session_state["progress"]
     st_autorefresh(interval=REFRESH_INTERVAL, limit=None, key="refresh")
     
-    for progress_, total, desc in zip(
-        progress.progresses,
-        progress.totals,
-        progress.descs
-    ):
-        value = progress_ / total
+    for progress_, total, desc in progress.snapshot():
+        value = progress_ / total if total else 1.0
         st.progress(value, desc)
-    
\ No newline at end of file
+
+    partial_result = st.session_state.get("partial_result")
+    if partial_result is not None and len(partial_result.articles):
+        articles = partial_result.articles
+        match_mask = partial_result.matcher_result.match_mask(
+            len(articles),
+            len(st.session_state["keywords"])
+        )
+        matched = [a for a, mask in zip(articles, match_mask) if mask]
+        st.write(f"Bisherige Treffer: {len(matched)} von {len(articles)} Artikeln")
+        st.dataframe(
+            pd.DataFrame({
+                "title": [a.title for a in matched],
+                "source": [a.source for a in matched]
+            }),
+            column_config={
+                "title": st.column_config.TextColumn("Titel"),
+                "source": st.column_config.TextColumn("Quelle")
+            },
+            hide_index=True
+        )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from collections import deque
+from typing import Dict, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """
+    Finds all occurrences of many patterns in one pass over a text, overlapping
+    ones included. Build it once per pattern set, matching is case-sensitive.
+    """
+
+    _patterns: List[str]
+    _word_boundaries: bool
+    # Transitions per state, a missing char continues from the root's transition
+    _delta: List[Dict[str, int]]
+    # Indexes of the patterns ending in each state
+    _outputs: List[Tuple[int, ...]]
+
+    def __init__(self, patterns: List[str], word_boundaries: bool = False):
+        self._patterns = list(patterns)
+        self._word_boundaries = word_boundaries
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, pattern in enumerate(self._patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = goto[state][char] = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # Breadth first, the failure state of a state is always done before it
+        fail = [0] * len(goto)
+        order = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for char, next_state in goto[state].items():
+                failure = fail[state]
+                while failure and char not in goto[failure]:
+                    failure = fail[failure]
+                fail[next_state] = goto[failure].get(char, 0)
+                outputs[next_state].extend(outputs[fail[next_state]])
+                queue.append(next_state)
+
+        # Follow failures at build time, so matching takes one lookup per char
+        delta = [dict(transitions) for transitions in goto]
+        for state in order:
+            for char, next_state in delta[fail[state]].items():
+                delta[state].setdefault(char, next_state)
+        root = delta[0]
+        self._delta = [root] + [
+            {char: next_state for char, next_state in transitions.items() if root.get(char) != next_state}
+            for transitions in delta[1:]
+        ]
+        self._outputs = [tuple(output) for output in outputs]
+
+    @property
+    def patterns(self) -> List[str]:
+        return self._patterns
+
+    def find_all(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """(pattern index, start, end) of every occurrence, ordered by end."""
+        delta = self._delta
+        root = delta[0]
+        outputs = self._outputs
+        state = 0
+        for position, char in enumerate(text):
+            next_state = delta[state].get(char)
+            state = root.get(char, 0) if next_state is None else next_state
+            if outputs[state]:
+                end = position + 1
+                for index in outputs[state]:
+                    start = end - len(self._patterns[index])
+                    if self._word_boundaries and not self._is_word(text, start, end):
+                        continue
+                    yield index, start, end
+
+    def find(self, text: str) -> List[bool]:
+        """Per pattern, whether it occurs in `text`."""
+        found = [False] * len(self._patterns)
+        for index, _start, _end in self.find_all(text):
+            found[index] = True
+        return found
+
+    @staticmethod
+    def _is_word(text: str, start: int, end: int) -> bool:
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        return not (before.isalnum() or before == "_" or after.isalnum() or after == "_")
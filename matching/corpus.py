@@ -0,0 +1,56 @@
+from __future__ import annotations
+from functools import cached_property
+from typing import List, Tuple
+from stemmer import Stemmer
+
+
+class Corpus:
+    """
+    Texts preprocessed once for all sub-matchers. Every view is computed on
+    first use and memoized, so a run only pays for the views its matchers use.
+    """
+
+    _VIEWS: Tuple[str, ...] = ("lower", "tokens", "offsets", "stems", "stem_texts")
+
+    _texts: List[str]
+
+    def __init__(self, texts: List[str]):
+        self._texts = list(texts)
+
+    @classmethod
+    def join(cls, corpora: List[Corpus]) -> Corpus:
+        """All texts of `corpora`, keeping the views every one of them computed."""
+        corpus = cls([text for part in corpora for text in part.texts])
+        for view in cls._VIEWS:
+            if corpora and all(view in part.__dict__ for part in corpora):
+                corpus.__dict__[view] = [item for part in corpora for item in part.__dict__[view]]
+        return corpus
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    @property
+    def texts(self) -> List[str]:
+        return self._texts
+
+    @cached_property
+    def lower(self) -> List[str]:
+        return [text.lower() for text in self._texts]
+
+    @cached_property
+    def tokens(self) -> List[List[str]]:
+        return [Stemmer.word_tokenize(text) for text in self._texts]
+
+    @cached_property
+    def offsets(self) -> List[List[Tuple[int, int]]]:
+        """Per text the (start, end) of each token."""
+        return [Stemmer.word_offsets(text) for text in self._texts]
+
+    @cached_property
+    def stems(self) -> List[List[str]]:
+        return [Stemmer.stem_tokens(tokens) for tokens in self.tokens]
+
+    @cached_property
+    def stem_texts(self) -> List[str]:
+        """Per text its stems joined by spaces, like `Stemmer.stem`."""
+        return [" ".join(stems) for stems in self.stems]
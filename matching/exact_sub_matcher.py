@@ -1,31 +1,64 @@
 from __future__ import annotations
+from matching.aho_corasick import AhoCorasick
+from matching.corpus import Corpus
 from matching.sub_matcher import SubMatcher
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 
 class ExactSubMatcher(SubMatcher):
 
     @dataclass
     class Parameters(SubMatcher.Parameters):
-        pass
+        word_boundaries: bool = False  # "Statistik" does not match "Bundesstatistik"
+        positions: bool = False
 
     @dataclass
     class Result(SubMatcher.Result):
+        # Per text and keyword the (start, end) of each match, if requested
+        positions: List[List[List[Tuple[int, int]]]] | None = None
 
         def filter_by_mask(self, mask: List[bool]) -> "SubMatcher.Result":
             """Default implementation: filter the outer list (texts)."""
             filtered_matches = [row for row, keep in zip(self.matches, mask) if keep]
-            return type(self)(filtered_matches)  # works for simple results
+            filtered_positions = None
+            if self.positions is not None:
+                filtered_positions = [row for row, keep in zip(self.positions, mask) if keep]
+            return type(self)(filtered_matches, filtered_positions)
+
+        def extend(self, other: "SubMatcher.Result"):
+            assert isinstance(other, ExactSubMatcher.Result)
+            self.matches.extend(other.matches)
+            if self.positions is not None and other.positions is not None:
+                self.positions.extend(other.positions)
+
+    def match(self, keywords: Corpus, texts: Corpus, parameters: Parameters) -> Result:  # type: ignore
+        automaton = self._automaton(tuple(keywords.lower), parameters.word_boundaries)
+
+        if not parameters.positions:
+            return ExactSubMatcher.Result([automaton.find(lower_text) for lower_text in texts.lower])
 
-    def match(self, keywords: List[str], texts: List[str], parameters: Parameters) -> Result:  # type: ignore
-        lower_keywords = [keyword.lower() for keyword in keywords]
-        lower_texts = [text.lower() for text in texts]
-        
         matches = []
-        for lower_text in lower_texts:
-            matches.append([])
-            for lower_keyword in lower_keywords:
-                matches[-1].append(lower_keyword.lower() in lower_text.lower())
-        return ExactSubMatcher.Result(matches)
-        
\ No newline at end of file
+        positions = []
+        for text in texts.texts:
+            text_positions: List[List[Tuple[int, int]]] = [[] for _ in keywords]
+            for index, start, end in automaton.find_all(self._lower_in_place(text)):
+                text_positions[index].append((start, end))
+            matches.append([bool(keyword_positions) for keyword_positions in text_positions])
+            positions.append(text_positions)
+        return ExactSubMatcher.Result(matches, positions)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _automaton(lower_keywords: Tuple[str, ...], word_boundaries: bool) -> AhoCorasick:
+        # Built once per keyword set, streaming matches every batch with it
+        return AhoCorasick(list(lower_keywords), word_boundaries)
+
+    @staticmethod
+    def _lower_in_place(text: str) -> str:
+        lower_text = text.lower()
+        if len(lower_text) == len(text):
+            return lower_text
+        # Some chars lower to several, positions must stay valid in the original text
+        return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
@@ -1,3 +1,4 @@
+from matching.corpus import Corpus
 from matching.sub_matcher import SubMatcher
 from matching.exact_sub_matcher import ExactSubMatcher
 from matching.stem_sub_matcher import StemSubMatcher
@@ -49,7 +50,7 @@ class Matcher:
                     [[False for _0 in range(n_keywords)] for _1 in range(n_texts)]
                 ),
                 self.similarity_result or SimilaritySubMatcher.Result(
-                    [[False for _0 in range(n_keywords) for _1 in range(n_texts)]],
+                    [[False for _0 in range(n_keywords)] for _1 in range(n_texts)],
                     np.empty(shape=(n_texts, n_keywords))
                 )
             ]
@@ -85,12 +86,81 @@ class Matcher:
 
     def match(self, parameters: Parameters, keywords: List[str], texts: List[str], progress: Progress) -> Result:
         result = self.Result()
+        # Shared, so texts are lowercased, tokenized and stemmed once for all sub matchers
+        keyword_corpus = Corpus(keywords)
+        corpus = Corpus(texts)
 
         for sub_matcher_key, sub_matcher in progress.start_iteration(self._SUB_MATCHERS.items(), len(self._SUB_MATCHERS.items()), desc="Matching"):
             if SubMatcherType(sub_matcher_key) in parameters.sub_matcher_selection:
                 sub_matcher_parameters = getattr(parameters, f"{sub_matcher_key}_parameters")
                 assert sub_matcher_parameters is not None
-                sub_matcher_result = sub_matcher.match(keywords, texts, sub_matcher_parameters)
+                sub_matcher_result = sub_matcher.match(keyword_corpus, corpus, sub_matcher_parameters)
                 setattr(result, f"{sub_matcher_key}_result", sub_matcher_result)
 
         return result
+
+
+class StreamingMatcher:
+    """
+    Matches texts in micro-batches while they arrive. Exact and stem matches
+    only depend on the text itself and are final per batch. The similarity
+    matcher needs tf-idf statistics of the whole corpus, so it runs once in
+    `finish`.
+    """
+
+    _PER_TEXT: Set[SubMatcherType] = {SubMatcherType.EXACT, SubMatcherType.STEM}
+
+    _parameters: Matcher.Parameters
+    _keywords: Corpus
+    _result: Matcher.Result
+    # Batches kept for the similarity matcher, with the stems already computed
+    _corpora: List[Corpus]
+
+    def __init__(self, parameters: Matcher.Parameters, keywords: List[str]):
+        self._parameters = parameters
+        self._keywords = Corpus(keywords)
+        self._result = Matcher.Result()
+        self._corpora = []
+        self.add([])
+
+    @property
+    def result(self) -> Matcher.Result:
+        """Results of all batches so far, without similarity matches."""
+        return self._result
+
+    def add(self, texts: List[str]):
+        corpus = Corpus(texts)
+        for sub_matcher_key, sub_matcher in Matcher._SUB_MATCHERS.items():
+            sub_matcher_type = SubMatcherType(sub_matcher_key)
+            if sub_matcher_type not in self._parameters.sub_matcher_selection:
+                continue
+            if sub_matcher_type not in self._PER_TEXT:
+                continue
+            sub_matcher_parameters = getattr(self._parameters, f"{sub_matcher_key}_parameters")
+            assert sub_matcher_parameters is not None
+            batch_result = sub_matcher.match(self._keywords, corpus, sub_matcher_parameters)
+            result = getattr(self._result, f"{sub_matcher_key}_result")
+            if result is None:
+                setattr(self._result, f"{sub_matcher_key}_result", batch_result)
+            else:
+                result.extend(batch_result)
+
+        if SubMatcherType.SIMILARITY in self._parameters.sub_matcher_selection:
+            self._corpora.append(corpus)
+
+    def finish(self, progress: Progress) -> Matcher.Result:
+        if SubMatcherType.SIMILARITY in self._parameters.sub_matcher_selection:
+            similarity_parameters = self._parameters.similarity_parameters
+            assert similarity_parameters is not None
+            for sub_matcher in progress.start_iteration([Matcher._SUB_MATCHERS["similarity"]], 1, desc="Matching"):
+                corpus = Corpus.join(self._corpora)
+                if len(corpus):
+                    self._result.similarity_result = sub_matcher.match(  # type: ignore
+                        self._keywords, corpus, similarity_parameters
+                    )
+                else:
+                    self._result.similarity_result = SimilaritySubMatcher.Result(
+                        [], np.zeros((0, len(self._keywords)))
+                    )
+            self._corpora = []
+        return self._result
@@ -2,8 +2,8 @@ from __future__ import annotations
 from matching.sub_matcher import SubMatcher
 from dataclasses import dataclass
 from typing import List, Set
+from matching.corpus import Corpus
 from nltk.stem import SnowballStemmer
-from stemmer import Stemmer
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
@@ -27,14 +27,19 @@ class SimilaritySubMatcher(SubMatcher):
                 cosine_similarities=self.cosine_similarities[idx]
             )
 
+        def extend(self, other: "SubMatcher.Result"):
+            assert isinstance(other, SimilaritySubMatcher.Result)
+            self.matches.extend(other.matches)
+            self.cosine_similarities = np.vstack([self.cosine_similarities, other.cosine_similarities])
+
     _LANGUAGE: str = "german"
     _STEMMER: SnowballStemmer = SnowballStemmer(_LANGUAGE)
     with open("german_stopwords.json", 'r') as file:
         _STOPWORDS: Set[str] = set(json.load(file))
 
-    def match(self, keywords: List[str], texts: List[str], parameters: Parameters) -> Result:  # type: ignore
-        keyword_stems = [Stemmer.stem(keyword) for keyword in keywords]
-        text_stems = [Stemmer.stem(text) for text in texts]
+    def match(self, keywords: Corpus, texts: Corpus, parameters: Parameters) -> Result:  # type: ignore
+        keyword_stems = keywords.stem_texts
+        text_stems = texts.stem_texts
         
         vectorizer = TfidfVectorizer(stop_words=list(self._STOPWORDS))
         tfidf_matrix = vectorizer.fit_transform(text_stems)
@@ -2,8 +2,8 @@ from __future__ import annotations
 from matching.sub_matcher import SubMatcher
 from dataclasses import dataclass
 from typing import List
+from matching.corpus import Corpus
 from nltk.stem import SnowballStemmer
-from stemmer import Stemmer
 
 
 class StemSubMatcher(SubMatcher):
@@ -23,9 +23,9 @@ class StemSubMatcher(SubMatcher):
     _LANGUAGE: str = "german"
     _STEMMER: SnowballStemmer = SnowballStemmer(_LANGUAGE)
 
-    def match(self, keywords: List[str], texts: List[str], parameters: Parameters) -> Result:  # type: ignore
-        keyword_stems = [Stemmer.stem(keyword) for keyword in keywords]
-        text_stems = [Stemmer.stem(text) for text in texts]
+    def match(self, keywords: Corpus, texts: Corpus, parameters: Parameters) -> Result:  # type: ignore
+        keyword_stems = keywords.stem_texts
+        text_stems = texts.stem_texts
         
         matches = []
         for text_stem in text_stems:
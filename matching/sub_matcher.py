@@ -2,6 +2,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List
+from matching.corpus import Corpus
 
 
 class SubMatcher(ABC):
@@ -14,6 +15,10 @@ class SubMatcher(ABC):
     class Result(ABC):
         matches: List[List[bool]]
 
+        def extend(self, other: "SubMatcher.Result"):
+            """Append the results of another batch of texts."""
+            self.matches.extend(other.matches)
+
     def __init__subclass__(cls, **_) -> None:  # type: ignore
         super().__init_subclass__()
         parameters_class = getattr(cls, "Parameters", None) 
@@ -24,6 +29,6 @@ class SubMatcher(ABC):
         assert issubclass(result_class, SubMatcher.Result)
 
     @abstractmethod
-    def match(self, keywords: List[str], texts: List[str], parameters: SubMatcher.Parameters) -> Result:
+    def match(self, keywords: Corpus, texts: Corpus, parameters: SubMatcher.Parameters) -> Result:
         raise NotImplementedError("@abstractmethod")
     
\ No newline at end of file
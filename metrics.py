@@ -0,0 +1,185 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Dict, List, Tuple
+import json
+import math
+import os
+
+
+class Metrics:
+    """
+    Process-wide counters and histograms, labelled e.g. by source, with a
+    JSON report and a Prometheus text export (file or local endpoint).
+    """
+
+    _Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+    @dataclass
+    class Histogram:
+        buckets: Tuple[float, ...]  # upper bounds, +Inf is implicit
+        counts: List[int]  # per bucket, not cumulative
+        sum: float = 0.0
+        count: int = 0
+
+        def quantile(self, q: float) -> float:
+            """Upper bound of the bucket containing the `q` quantile."""
+            rank = q * self.count
+            seen = 0
+            for bound, count in zip(self.buckets, self.counts):
+                seen += count
+                if seen >= rank:
+                    return bound
+            return math.inf
+
+    # s, from cached pages to slow detail pages
+    DURATION_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    _counters: Dict[_Key, float]
+    _histograms: Dict[_Key, Histogram]
+    _lock: Lock
+
+    def __init__(self):
+        self._counters = {}
+        self._histograms = {}
+        self._lock = Lock()
+
+    def increment(self, name: str, amount: float = 1.0, **labels: str):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def counter(self, name: str, **labels: str) -> float:
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0.0)
+
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...] = DURATION_BUCKETS, **labels: str):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = self.Histogram(buckets, [0] * len(buckets))
+            for i, bound in enumerate(histogram.buckets):
+                if value <= bound:
+                    histogram.counts[i] += 1
+                    break
+            histogram.sum += value
+            histogram.count += 1
+
+    def histogram(self, name: str, **labels: str) -> Histogram | None:
+        with self._lock:
+            histogram = self._histograms.get(self._key(name, labels))
+            if histogram is None:
+                return None
+            return self.Histogram(histogram.buckets, list(histogram.counts), histogram.sum, histogram.count)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def report(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Everything recorded so far, as JSON serializable dicts."""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "mean": histogram.sum / histogram.count if histogram.count else 0.0,
+                    "p50": self._bound(histogram.quantile(0.5)),
+                    "p95": self._bound(histogram.quantile(0.95)),
+                    "buckets": {str(bound): count for bound, count in zip(histogram.buckets, histogram.counts)}
+                }
+                for (name, labels), histogram in sorted(self._histograms.items())
+            ]
+        return {"counters": counters, "histograms": histograms}
+
+    def to_json(self) -> str:
+        return json.dumps(self.report(), indent=2, ensure_ascii=False)
+
+    def to_prometheus(self) -> str:
+        lines = []
+        typed = set()
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in typed:
+                    typed.add(name)
+                    lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name}{self._labels(labels)} {value:g}")
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                if name not in typed:
+                    typed.add(name)
+                    lines.append(f"# TYPE {name} histogram")
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{self._labels(labels + (('le', f'{bound:g}'),))} {cumulative}")
+                lines.append(f"{name}_bucket{self._labels(labels + (('le', '+Inf'),))} {histogram.count}")
+                lines.append(f"{name}_sum{self._labels(labels)} {histogram.sum:g}")
+                lines.append(f"{name}_count{self._labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: str, name: str = "metrics"):
+        """Write `<name>.json` and `<name>.prom`, e.g. for a textfile collector."""
+        os.makedirs(directory, exist_ok=True)
+        for extension, text in (("json", self.to_json()), ("prom", self.to_prometheus())):
+            filename = os.path.join(directory, f"{name}.{extension}")
+            # Replace atomically, collectors must never read half a file
+            with open(filename + ".tmp", 'w', encoding="utf-8") as file:
+                file.write(text)
+            os.replace(filename + ".tmp", filename)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve `/metrics` (Prometheus text) and `/metrics.json` on a daemon thread."""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, content_type = metrics.to_prometheus(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, content_type = metrics.to_json(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+        return server
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> _Key:
+        return name, tuple(sorted(labels.items()))
+
+    @staticmethod
+    def _labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+        if not labels:
+            return ""
+        escaped = (
+            key + '="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+            for key, value in labels
+        )
+        return "{" + ",".join(escaped) + "}"
+
+    @staticmethod
+    def _bound(value: float) -> float | str:
+        return value if math.isfinite(value) else "+Inf"
+
+
+METRICS: Metrics = Metrics()
@@ -1,55 +1,88 @@
 from tqdm import tqdm
-from typing import Any, Generator, Iterable, List
+from contextvars import ContextVar
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+from typing import Any, Dict, Generator, Iterable, List, Tuple
 
 
 class Progress:
 
-    _bars: List[tqdm]
-    _next_position: int
-    
-    progresses: List[int]
-    totals: List[int]
-    descs: List[str]
+    @dataclass
+    class _Process:
+        bar: tqdm
+        progress: int
+        total: int
+        desc: str
+
+    _processes: Dict[int, _Process]
+    _stack: ContextVar[Tuple[int, ...]]
+    _ids: Any
+    _lock: Lock
+
     error_messages: List[str]
 
     def __init__(self):
-        self._bars = []
-        self._next_position = 0
-        self.progresses = []
-        self.totals = []
-        self.descs = []
+        # Each thread (and each asyncio task) keeps its own stack of open
+        # processes, so concurrently running scrapers do not update each
+        # other's bars.
+        self._processes = {}
+        self._stack = ContextVar(f"progress_stack_{id(self)}", default=())
+        self._ids = count()
+        self._lock = Lock()
         self.error_messages = []
-    
+
+    @property
+    def progresses(self) -> List[int]:
+        with self._lock:
+            return [p.progress for p in self._processes.values()]
+
+    @property
+    def totals(self) -> List[int]:
+        with self._lock:
+            return [p.total for p in self._processes.values()]
+
+    @property
+    def descs(self) -> List[str]:
+        with self._lock:
+            return [p.desc for p in self._processes.values()]
+
+    def snapshot(self) -> List[Tuple[int, int, str]]:
+        with self._lock:
+            return [(p.progress, p.total, p.desc) for p in self._processes.values()]
+
     def start_process(self, total: int, desc: str):
-        self._bars.append(
-            tqdm(
-                total=total, 
-                position=self._next_position, 
-                leave=True, 
-                desc=desc
+        with self._lock:
+            process_id = next(self._ids)
+            self._processes[process_id] = self._Process(
+                tqdm(
+                    total=total,
+                    position=len(self._processes),
+                    leave=True,
+                    desc=desc
+                ),
+                0,
+                total,
+                desc
             )
-        )
-        self._next_position += 1
-        self.progresses.append(0)
-        self.totals.append(total)
-        self.descs.append(desc)
+        self._stack.set(self._stack.get() + (process_id,))
 
     def update_process(self, increment: int = 1):
-        self._bars[-1].update(increment)
-        self.progresses[-1] += increment
+        with self._lock:
+            process = self._processes[self._stack.get()[-1]]
+            process.bar.update(increment)
+            process.progress += increment
 
     def end_process(self):
-        self._bars[-1].close()
-        self._bars.pop()
-        self._next_position -= 1
-        self.progresses.pop()
-        self.totals.pop()
-        self.descs.pop()
+        stack = self._stack.get()
+        with self._lock:
+            self._processes.pop(stack[-1]).bar.close()
+        self._stack.set(stack[:-1])
 
     def start_iteration(
-        self, 
-        iterable: Iterable, 
-        total: int, 
+        self,
+        iterable: Iterable,
+        total: int,
         desc: str
     ) -> Generator[Any, None, None]:
         self.start_process(total, desc)
@@ -59,5 +92,5 @@ class Progress:
         self.end_process()
 
     def add_error_message(self, message: str):
-        self.error_messages.append(message)
-        
\ No newline at end of file
+        with self._lock:
+            self.error_messages.append(message)
@@ -1,99 +1,46 @@
 from typing import List
-from article import Article
-from scrapers.scraper import Scraper
-from dataclasses import dataclass
-from datetime import datetime
-from bs4 import BeautifulSoup 
+from bs4 import BeautifulSoup
 from bs4.element import Tag
-from progress import Progress
-
-
-class DscScraper(Scraper):
-
-    SOURCE: str = "DSC"
-
-    @dataclass
-    class Parameters(Scraper.Parameters):
-        pass
-
-    def scrape(self, parameters: Scraper.Parameters, progress: Progress) -> List[Article]:
-        html = self._get(self._URL, progress, f"Fehler beim Scrapen der Quelle: {self.SOURCE}")
-        if html is None:
-            return []
-
-        soup = BeautifulSoup(html, "html.parser")
-
-        body_text = soup.find("div", class_="bodyText")
-        assert body_text
-
-        h2 = body_text.find("h2", string="Pressemitteilungen")  # type: ignore
-        assert h2
-
-        entries = []
-        for tag in h2.next_siblings:
-            if not isinstance(tag, Tag):
-                continue
-            if tag.name == "p":
-                a = tag.find("a")
-                assert a
-                text = a.get_text()
-                date_str, title_str = text.split(":")
-
-                day, month, year = date_str.strip().split(" ")
-                day = int(day.strip("."))
-                month = self._GERMAN_MONTHS.index(month.strip())
-                year = int(year.strip())
-                timestamp = datetime(day=day, month=month, year=year)
-
-                title = title_str.strip()
-
-                link = str(a["href"])
-
-                entries.append((title, link, timestamp))
+from scrapers.scraper import Scraper
+from scrapers.scraper_spec import ArticleRule, FieldRule, ListingRule, ScraperSpec
+from scrapers.spec_scraper import SpecScraper
 
-            else:
-                break
 
-        articles = []
-        for title, link, timestamp in progress.start_iteration(entries, total=len(entries), desc="Scraping DSC articles"):
-            html = self._get(link, progress, f"Fehler beim Scrapen der Quelle: {self.SOURCE} bei Artikel: {title}")
-            if html is None:
-                return []
-            
-            soup = BeautifulSoup(html, "html.parser")
+def _press_releases(soup: BeautifulSoup) -> List[Tag]:
+    """The paragraphs directly following the "Pressemitteilungen" heading."""
+    body_text = soup.find("div", class_="bodyText")
+    assert body_text
 
-            div = soup.find("div", class_="wrapperText")
-            assert div
+    h2 = body_text.find("h2", string="Pressemitteilungen")  # type: ignore
+    assert h2
 
-            ps = div.find_all("p", class_=False)
-            assert ps
-            content = "\n\n".join([p.text.strip() for p in ps][0])
+    items = []
+    for tag in h2.next_siblings:
+        if not isinstance(tag, Tag):
+            continue
+        if tag.name != "p":
+            break
+        items.append(tag)
+    return items
 
-            articles.append(Article(
-                timestamp=timestamp,
-                title=title,
-                medium_organisation=self.SOURCE,
-                content=content,
-                link=link, 
-                source=self.SOURCE
-            ))
 
-        return self._filter_dates(articles, parameters)
+class DscScraper(SpecScraper):
 
     _URL_PREFIX: str = "https://www.dsc.bund.de/"
-    _URL: str = f"{_URL_PREFIX}DSC/DE/Aktuelles/start.html"
-    _GERMAN_MONTHS: List[str] = [
-        "",
-        "Januar",
-        "Februar",
-        "März",
-        "April",
-        "Mai",
-        "Juni",
-        "Juli",
-        "August",
-        "September",
-        "Oktober",
-        "November",
-        "Dezember"
-    ]
+
+    SPEC: ScraperSpec = ScraperSpec(
+        source="DSC",
+        url=f"{_URL_PREFIX}DSC/DE/Aktuelles/start.html",
+        listing=ListingRule(
+            items=_press_releases,
+            # "<date>: <title>"
+            date=FieldRule("a", pattern=r"^([^:]*):"),
+            title=FieldRule("a", pattern=r":(.*)"),
+            link=FieldRule("a", "href"),
+            strainer=Scraper._strainer(["div"], ["bodyText"])
+        ),
+        article=ArticleRule(
+            "div.wrapperText p:not([class])",
+            strainer=Scraper._strainer(["div"], ["wrapperText"])
+        )
+    )
@@ -1,54 +1,39 @@
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List
 from article import Article
 from scrapers.scraper import Scraper
-from dataclasses import dataclass
+from scrapers.scraper_spec import ArticleRule, Axis, FieldRule, ListingRule, ScraperSpec
+from scrapers.spec_scraper import SpecScraper
+from dataclasses import dataclass, replace
 from datetime import datetime
-from bs4 import BeautifulSoup 
 from progress import Progress
-
-
-class HibScraper(Scraper):
-
-    SOURCE: str = "Heute im Bundestag"
-
-    @dataclass
-    class Parameters(Scraper.Parameters):
-        pass
-
-    def scrape(self, parameters: Scraper.Parameters, progress: Progress) -> List[Article]:
-        entry_parameters = self._EntryParameters(
-            start_date=parameters.start_date,
-            end_date=parameters.end_date,
-            offset=0,
-            limit=self._LIMIT
+import asyncio
+
+
+class HibScraper(SpecScraper):
+
+    SPEC: ScraperSpec = ScraperSpec(
+        source="Heute im Bundestag",
+        url="https://www.bundestag.de/ajax/filterlist/de/presse/hib/454590-454590",
+        # The listing is an ajax fragment already, only article pages are restricted
+        listing=ListingRule(
+            items="div.bt-listenteaser ul.bt-linkliste li",
+            date=FieldRule("h4", axis=Axis.PREVIOUS),
+            title=FieldRule("a.bt-link-intern"),
+            link=FieldRule("a.bt-link-intern", "href")
+        ),
+        article=ArticleRule(
+            "div.bt-artikel__article",
+            markdown=True,
+            first_line=True,
+            # "<organisation>, ... — hib <number>"
+            medium_organisation=FieldRule("span.bt-dachzeile", pattern=r"^\s*([^\s,—]+)"),
+            strainer=Scraper._strainer(["div", "span"], ["bt-artikel__article", "bt-dachzeile"])
         )
-        entries = self._scrape_entries(entry_parameters, progress)
-        articles = self._scrape_articles(entries, progress)
-        articles = self._filter_dates(articles, parameters)
-
-        articles = list(set(articles))
-
-        return articles
+    )
 
     _LIMIT: int = 20
     _MS_PER_S: int = 1_000
-    _URL: str = "https://www.bundestag.de/ajax/filterlist/de/presse/hib/454590-454590"
     _ARCIVE_URL: str = "https://www.bundestag.de/ajax/filterlist/webarchiv/presse/hib/867560-867560"
-    _GERMAN_MONTHS: List[str] = [
-        "",
-        "Januar",
-        "Februar",
-        "März",
-        "April",
-        "Mai",
-        "Juni",
-        "Juli",
-        "August",
-        "September",
-        "Oktober",
-        "November",
-        "Dezember"
-    ]
 
     @dataclass
     class _EntryParameters:
@@ -72,90 +57,36 @@ class HibScraper(Scraper):
                 "endfield": self.end_field
             }
 
-    @dataclass
-    class _Entry:
-        title: str
-        url: str
-        timestamp: datetime
-    
-    def _scrape_entries_with_url(self, url: str, parameters: _EntryParameters, progress: Progress) -> List[_Entry]:
-        entry_length = -1
-        n_iterations = 0
-        entries = []
-        parameters.offset = 0
-
-        while entry_length != len(entries):
-            entry_length = len(entries)
-            parameters.offset = n_iterations * self._LIMIT
-
-            html = self._get(self._URL, progress, f"Fehler beim Scrapen der Quelle: {self.SOURCE}", parameters=parameters.to_dict())
-            if html is None:
-                return []
-
-            soup = BeautifulSoup(html, "html.parser")
-            containers = soup.find_all("div", class_="bt-listenteaser")
-            if not containers:
-                break
-
-            items = []
-            for container in containers:
-                items.extend(container.select("ul.bt-linkliste li"))
-
-            for li in items:
-                a_tag = li.find("a", class_="bt-link-intern")
-                assert a_tag is not None
-                title = a_tag.get_text(strip=True)
-
-                url = a_tag["href"]
+    async def astream(self, parameters: Scraper.Parameters, progress: Progress) -> AsyncIterator[Article]:
+        seen = set()
+        async for article in super().astream(parameters, progress):
+            if article not in seen:
+                seen.add(article)
+                yield article
 
-                h4_tag = li.find_previous("h4")
-                assert h4_tag is not None
-                date_str = h4_tag.get_text(strip=True)
-
-                day, month, year = date_str.split(" ")
-                day = int(day[:-1])
-                month = self._GERMAN_MONTHS.index(month)
-                year = int(year)
-
-                timestamp = datetime(year=year, month=month, day=day)
-
-                entries.append(self._Entry(title, url, timestamp))
-
-            n_iterations += 1
-
-        return entries
-
-    def _scrape_entries(self, parameters: _EntryParameters, progress: Progress) -> List[_Entry]:
-        entries = self._scrape_entries_with_url(self._URL, parameters, progress)
-        entries.extend(self._scrape_entries_with_url(self._ARCIVE_URL, parameters, progress))
-        return entries
-
-    def _scrape_articles(self, entries: List[_Entry], progress: Progress) -> List[Article]:
-        articles = []
-        for entry in progress.start_iteration(entries, total=len(entries), desc="Scraping 'Heute im Bundestag' Artikel"):
-            html = self._get(entry.url, progress, f"Fehler beim Scrapen der Quelle: {self.SOURCE} bei Artikel {entry.title}")
-            if html is None:
-                return []
-
-            soup = BeautifulSoup(html, "html.parser")
-            article_div=soup.find("div", class_="bt-artikel__article")
-            assert article_div is not None
-            content = self._content_to_markdown(article_div).strip()
-            content = content.split("\n")[0]
-
-            header_line = soup.find("span", class_="bt-dachzeile")
-            assert header_line is not None
-            header_string = header_line.text
-            medium_organisation = header_string.split("—")[0].strip().split(" ")[0].strip().replace(",", "")
-
-            articles.append(Article(
-                timestamp=entry.timestamp,
-                title=entry.title,
-                medium_organisation=medium_organisation,
-                content=content,
-                link=entry.url,
-                source=self.SOURCE
-            ))
-
-        return articles
-       
\ No newline at end of file
+    async def _aitems(self, parameters: Scraper.Parameters, progress: Progress) -> List | None:
+        # The listing pages by offset, in the current list and the archive
+        entry_parameters = self._EntryParameters(
+            start_date=parameters.start_date,
+            end_date=parameters.end_date,
+            offset=0,
+            limit=self._LIMIT
+        )
+        entries, archive_entries = await asyncio.gather(
+            self._scrape_entries_with_url(self.SPEC.url, entry_parameters, progress),
+            self._scrape_entries_with_url(self._ARCIVE_URL, entry_parameters, progress)
+        )
+        # Articles still in the current list can show up in the archive as well
+        unique = {}
+        for entry in entries + archive_entries:
+            unique.setdefault(entry.link, entry)
+        return list(unique.values())
+
+    async def _scrape_entries_with_url(self, url: str, parameters: _EntryParameters, progress: Progress) -> List[Scraper.Entry]:
+        return await self._apaginate(
+            lambda page: (url, replace(parameters, offset=page * self._LIMIT).to_dict()),
+            self._parse_listing,
+            parameters.start_date,
+            progress,
+            f"Fehler beim Scrapen der Quelle: {self.SOURCE}"
+        )
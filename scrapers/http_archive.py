@@ -0,0 +1,108 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from enum import Enum
+from threading import Lock
+from typing import Dict, Mapping
+from requests.structures import CaseInsensitiveDict
+from scrapers.http_cache import HttpCache
+import json
+import os
+import random
+import requests
+import time
+
+
+class ArchiveMode(Enum):
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class HttpArchive:
+    """
+    Records request/response pairs to a JSONL fixture archive and replays
+    them offline, optionally with simulated (deterministic) latency.
+    """
+
+    class MissingRecord(LookupError):
+        pass
+
+    @dataclass
+    class Parameters:
+        mode: ArchiveMode = ArchiveMode.OFF
+        filename: str = "fixtures/http_archive.jsonl"
+        latency: float = 0.0  # s, added to every replayed response
+        jitter: float = 0.0  # s, uniform on top of `latency`
+        seed: int = 0
+
+    @dataclass
+    class Record:
+        url: str
+        params: Dict[str, str]
+        status: int
+        headers: Dict[str, str]
+        body: str
+
+    _parameters: Parameters
+    _records: Dict[str, Record]
+    _lock: Lock
+
+    def __init__(self, parameters: Parameters | None = None):
+        self._parameters = parameters or self.Parameters()
+        self._records = {}
+        self._lock = Lock()
+        if self._parameters.mode == ArchiveMode.REPLAY:
+            self._load()
+
+    @property
+    def mode(self) -> ArchiveMode:
+        return self._parameters.mode
+
+    def record(self, url: str, params: Mapping[str, str] | None, response: requests.Response):
+        record = self.Record(
+            url=url,
+            params=dict(params or {}),
+            status=response.status_code,
+            headers={
+                key: value for key, value in response.headers.items()
+                if key.lower() in ("content-type", "etag", "last-modified", "retry-after")
+            },
+            body=response.text
+        )
+        line = json.dumps(asdict(record), ensure_ascii=False)
+        with self._lock:
+            self._records[HttpCache.key(url, params)] = record
+            os.makedirs(os.path.dirname(self._parameters.filename) or ".", exist_ok=True)
+            with open(self._parameters.filename, 'a', encoding="utf-8") as file:
+                file.write(line + "\n")
+
+    def replay(self, url: str, params: Mapping[str, str] | None) -> requests.Response:
+        key = HttpCache.key(url, params)
+        record = self._records.get(key)
+        if record is None:
+            raise self.MissingRecord(f"No recorded response for {url} {dict(params or {})}")
+
+        # Seeded per request, so the latency does not depend on request order
+        rng = random.Random(f"{self._parameters.seed}:{key}")
+        delay = self._parameters.latency + rng.uniform(0.0, self._parameters.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = record.status
+        response.headers = CaseInsensitiveDict(record.headers)
+        response._content = record.body.encode("utf-8")
+        response.encoding = "utf-8"
+        return response
+
+    def _load(self):
+        if not os.path.exists(self._parameters.filename):
+            return
+        with open(self._parameters.filename, 'r', encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = self.Record(**json.loads(line))
+                # Later recordings of the same request win
+                self._records[HttpCache.key(record.url, record.params)] = record
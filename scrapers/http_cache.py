@@ -0,0 +1,174 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import Lock
+from typing import Dict, Mapping
+from urllib.parse import urlencode
+import os
+import sqlite3
+import time
+
+
+class HttpCache:
+    """Disk-backed, size-bounded LRU cache of fetched pages."""
+
+    @dataclass
+    class Parameters:
+        directory: str = ".cache/http"
+        max_size: int = 256 * 1024 * 1024  # bytes
+        immutable_ttl: float = 30 * 24 * 60 * 60  # s
+
+    @dataclass
+    class Entry:
+        body: str
+        etag: str | None
+        last_modified: str | None
+        stored_at: float
+
+        @property
+        def validators(self) -> Mapping[str, str]:
+            headers = {}
+            if self.etag is not None:
+                headers["If-None-Match"] = self.etag
+            if self.last_modified is not None:
+                headers["If-Modified-Since"] = self.last_modified
+            return headers
+
+    _FILENAME: str = "responses.sqlite3"
+    # Hits whose access times are written with one commit
+    _ACCESS_BATCH: int = 256
+
+    _parameters: Parameters
+    _connection: sqlite3.Connection
+    _size: int
+    # key -> access time, not yet written
+    _accessed: Dict[str, float]
+    _lock: Lock
+
+    def __init__(self, parameters: Parameters | None = None):
+        self._parameters = parameters or self.Parameters()
+        os.makedirs(self._parameters.directory, exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(self._parameters.directory, self._FILENAME),
+            check_same_thread=False
+        )
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self._connection.commit()
+        self._size = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        self._accessed = {}
+        self._lock = Lock()
+
+    @property
+    def parameters(self) -> Parameters:
+        return self._parameters
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, str] | None = None) -> str:
+        query = urlencode(sorted((params or {}).items()))
+        return sha256(f"{url}?{query}".encode()).hexdigest()
+
+    def is_fresh(self, entry: Entry) -> bool:
+        return time.time() - entry.stored_at <= self._parameters.immutable_ttl
+
+    def lookup(self, url: str, params: Mapping[str, str] | None = None) -> Entry | None:
+        key = self.key(url, params)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            # Hits stay free of disk writes, access times only matter for eviction
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= self._ACCESS_BATCH:
+                self._write_accessed()
+                self._connection.commit()
+        return self.Entry(*row)
+
+    def flush(self):
+        """Write the buffered access times."""
+        with self._lock:
+            self._write_accessed()
+            self._connection.commit()
+
+    def revalidated(self, url: str, params: Mapping[str, str] | None = None):
+        """Mark an entry as fresh after the server answered 304 Not Modified."""
+        now = time.time()
+        key = self.key(url, params)
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._write_accessed()
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key)
+            )
+            self._connection.commit()
+
+    def store(self, url: str, params: Mapping[str, str] | None, body: str, etag: str | None, last_modified: str | None):
+        key = self.key(url, params)
+        size = len(body.encode())
+        if size > self._parameters.max_size:
+            return
+        now = time.time()
+        with self._lock:
+            self._accessed.pop(key, None)
+            # Eviction must see the recent hits
+            self._write_accessed()
+            old_row = self._connection.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, now, now, size)
+            )
+            self._size += size - (old_row[0] if old_row else 0)
+            self._evict()
+            self._connection.commit()
+
+    def clear(self):
+        with self._lock:
+            self._accessed.clear()
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+            self._size = 0
+
+    def _write_accessed(self):
+        # Caller holds the lock and commits
+        if not self._accessed:
+            return
+        self._connection.executemany(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?",
+            [(accessed_at, key) for key, accessed_at in self._accessed.items()]
+        )
+        self._accessed.clear()
+
+    def _evict(self):
+        # Least recently used entries go first, caller holds the lock
+        while self._size > self._parameters.max_size:
+            rows = self._connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._size = 0
+                return
+            for key, size in rows:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size -= size
+                if self._size <= self._parameters.max_size:
+                    return
@@ -0,0 +1,108 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Condition
+import time
+
+
+class RateLimiter:
+    """
+    Politeness limits for one host: a token bucket caps the request rate and
+    an AIMD window caps the requests in flight. The window grows additively
+    while the host answers fast and shrinks multiplicatively on 429, 5xx,
+    connection errors or slow answers. `Retry-After` pauses the host.
+    """
+
+    @dataclass
+    class Parameters:
+        rate: float = 10.0  # requests/s
+        burst: int = 10
+        min_concurrency: int = 1
+        initial_concurrency: int = 4
+        max_concurrency: int = 16
+        latency_target: float = 2.0  # s, slower answers count as congestion
+        increase: float = 1.0  # window growth per window of fast answers
+        decrease: float = 0.5  # window factor on congestion
+
+    _parameters: Parameters
+    _condition: Condition
+    _tokens: float
+    _refilled_at: float
+    _window: float
+    _in_flight: int
+    _paused_until: float
+
+    def __init__(self, parameters: Parameters):
+        self._parameters = parameters
+        self._condition = Condition()
+        self._tokens = float(parameters.burst)
+        self._refilled_at = time.monotonic()
+        self._window = float(parameters.initial_concurrency)
+        self._in_flight = 0
+        self._paused_until = 0.0
+
+    @property
+    def concurrency(self) -> int:
+        return max(self._parameters.min_concurrency, int(self._window))
+
+    def acquire(self):
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self._in_flight >= self.concurrency:
+                    self._condition.wait()
+                    continue
+                wait = max(
+                    self._paused_until - now,
+                    (1.0 - self._tokens) / self._parameters.rate
+                )
+                if wait <= 0:
+                    break
+                self._condition.wait(wait)
+            self._tokens -= 1.0
+            self._in_flight += 1
+
+    def release(self, latency: float, status: int | None, retry_after: str | None = None):
+        with self._condition:
+            self._in_flight -= 1
+            congested = status is None or status == 429 or status >= 500 \
+                or latency > self._parameters.latency_target
+            if congested:
+                self._window = max(
+                    float(self._parameters.min_concurrency),
+                    self._window * self._parameters.decrease
+                )
+            else:
+                self._window = min(
+                    float(self._parameters.max_concurrency),
+                    self._window + self._parameters.increase / self._window
+                )
+            pause = self._parse_retry_after(retry_after)
+            if pause is not None:
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self._condition.notify_all()
+
+    def _refill(self, now: float):
+        self._tokens = min(
+            float(self._parameters.burst),
+            self._tokens + (now - self._refilled_at) * self._parameters.rate
+        )
+        self._refilled_at = now
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> float | None:
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            until = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if until.tzinfo is None:
+            until = until.replace(tzinfo=timezone.utc)
+        return max(0.0, (until - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from dataclasses import dataclass
+from threading import Event
+from typing import Callable
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, stop_after_delay, wait_random_exponential
+import requests
+import time
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+class RetryPolicy:
+    """
+    Retries transient failures (connection errors, timeouts, 429, 5xx) with
+    jittered exponential backoff inside an overall per-request deadline and
+    optionally hedges slow requests with one duplicate.
+    """
+
+    @dataclass
+    class Parameters:
+        attempts: int = 4
+        initial_backoff: float = 0.5  # s
+        max_backoff: float = 8.0  # s
+        deadline: float = 60.0  # s, for all attempts of one request
+        hedge_after: float | None = None  # s, duplicate requests slower than this
+
+    _RETRY_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    # Threads calling `call` at once, e.g. the scrapers' fetch threads
+    MAX_CALLERS: int = 256
+    # Room for the first attempt and the hedge of every caller, requests never queue here
+    _HEDGE_EXECUTOR: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2 * MAX_CALLERS, thread_name_prefix="scraper-hedge")
+
+    _parameters: Parameters
+
+    def __init__(self, parameters: Parameters):
+        self._parameters = parameters
+
+    def call(
+        self,
+        request: Callable[[float], requests.Response],
+        on_retry: Callable[[], None],
+        on_hedge: Callable[[], None]
+    ) -> requests.Response:
+        """Run `request`, which gets the time left until the deadline as its timeout."""
+        deadline_at = time.monotonic() + self._parameters.deadline
+
+        def attempt() -> requests.Response:
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceeded(f"No answer within {self._parameters.deadline}s")
+            response = self._hedged(request, remaining, on_hedge)
+            if response.status_code in self._RETRY_STATUS_CODES:
+                response.raise_for_status()
+            return response
+
+        retrying = Retrying(
+            stop=stop_after_attempt(self._parameters.attempts) | stop_after_delay(self._parameters.deadline),
+            wait=wait_random_exponential(multiplier=self._parameters.initial_backoff, max=self._parameters.max_backoff),
+            retry=retry_if_exception(self.is_transient),
+            before_sleep=lambda _: on_retry(),
+            reraise=True
+        )
+        return retrying(attempt)
+
+    @classmethod
+    def is_transient(cls, exception: BaseException) -> bool:
+        if isinstance(exception, requests.HTTPError):
+            response = exception.response
+            return response is not None and response.status_code in cls._RETRY_STATUS_CODES
+        return isinstance(exception, (requests.ConnectionError, requests.Timeout))
+
+    def _hedged(
+        self,
+        request: Callable[[float], requests.Response],
+        timeout: float,
+        on_hedge: Callable[[], None]
+    ) -> requests.Response:
+        hedge_after = self._parameters.hedge_after
+        if hedge_after is None or hedge_after >= timeout:
+            return request(timeout)
+
+        started = Event()
+
+        def first_request() -> requests.Response:
+            started.set()
+            return request(timeout)
+
+        first = self._HEDGE_EXECUTOR.submit(first_request)
+        # Slow is measured from the start, waiting for a thread must never cause a hedge
+        started.wait()
+        try:
+            return first.result(timeout=hedge_after)
+        except FutureTimeoutError:
+            pass
+
+        on_hedge()
+        pending = {first, self._HEDGE_EXECUTOR.submit(request, timeout - hedge_after)}
+        exception: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                exception = future.exception()
+                if exception is None:
+                    return future.result()
+        assert exception is not None
+        raise exception
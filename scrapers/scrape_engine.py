@@ -0,0 +1,174 @@
+from __future__ import annotations
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Iterator, List, Tuple
+from article import Article
+from metrics import METRICS
+from progress import Progress
+from scrapers.scraper import Scraper
+from scrapers.scrape_result_cache import ScrapeResultCache
+from thread import ThreadWithResult
+from threading import Event
+import asyncio
+import queue
+
+
+class ScrapeEngine:
+    """
+    Drives the scrapers of all selected sources on one event loop and writes
+    every scraped article to the article store. Articles are handed out in
+    micro-batches while slow sources are still being scraped.
+    """
+
+    @dataclass
+    class Result:
+        articles: List[Article] = field(default_factory=list)
+        errors: Dict[str, BaseException] = field(default_factory=dict)
+
+    _SCRAPE_BUCKETS: Tuple[float, ...] = (1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)  # s
+
+    # Shared by the engines of all sessions
+    _RESULT_CACHE: ScrapeResultCache | None = ScrapeResultCache()
+
+    _max_sources: int
+    _batch_size: int
+    _max_batch_delay: float
+
+    def __init__(self, max_sources: int = 12, batch_size: int = 32, max_batch_delay: float = 1.0):
+        self._max_sources = max_sources
+        self._batch_size = batch_size
+        self._max_batch_delay = max_batch_delay  # s
+
+    @classmethod
+    def configure_result_cache(cls, parameters: ScrapeResultCache.Parameters | None):
+        """Use a result cache with the given parameters, `None` disables it."""
+        cls._RESULT_CACHE = ScrapeResultCache(parameters) if parameters is not None else None
+
+    def scrape(self, scrapers: List[Scraper], parameters: Scraper.Parameters, progress: Progress) -> Result:
+        result = self.Result()
+        for batch in self.stream(scrapers, parameters, progress, result):
+            result.articles.extend(batch)
+        return result
+
+    def stream(
+        self,
+        scrapers: List[Scraper],
+        parameters: Scraper.Parameters,
+        progress: Progress,
+        result: Result
+    ) -> Iterator[List[Article]]:
+        """
+        Synchronous `astream`: the event loop runs on its own thread, so
+        scraping continues while the caller processes a batch. Errors of
+        single sources are collected in `result.errors`.
+        """
+        batches: queue.Queue = queue.Queue(maxsize=2)
+        done = object()
+        # Set when the caller stops early, e.g. on an exception while processing a batch
+        stopped = Event()
+
+        def put(item: object) -> bool:
+            while not stopped.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        async def produce():
+            loop = asyncio.get_running_loop()
+            try:
+                async with aclosing(self.astream(scrapers, parameters, progress, result)) as stream:
+                    async for batch in stream:
+                        # Wait without blocking the loop, sources keep scraping
+                        if not await loop.run_in_executor(None, put, batch):
+                            break
+            finally:
+                await loop.run_in_executor(None, put, done)
+
+        thread = ThreadWithResult(target=asyncio.run, args=(produce(),), daemon=True)
+        thread.start()
+        try:
+            while (batch := batches.get()) is not done:
+                yield batch
+        finally:
+            # Closing the stream cancels the sources, the loop and its thread end
+            stopped.set()
+            thread.join()
+        thread.result()
+
+    async def astream(
+        self,
+        scrapers: List[Scraper],
+        parameters: Scraper.Parameters,
+        progress: Progress,
+        result: Result
+    ) -> AsyncIterator[List[Article]]:
+        semaphore = asyncio.Semaphore(max(1, self._max_sources))
+        articles: asyncio.Queue = asyncio.Queue(maxsize=4 * self._batch_size)
+        finished = object()
+
+        async def scrape(scraper: Scraper):
+            try:
+                async with semaphore:
+                    start = loop.time()
+                    try:
+                        # Closed right away when cancelled, e.g. so the result cache settles its flight
+                        async with aclosing(self._astream_source(scraper, parameters, progress)) as stream:
+                            async for article in stream:
+                                METRICS.increment("scraper_articles_total", source=scraper.SOURCE)
+                                await articles.put(article)
+                    finally:
+                        METRICS.observe(
+                            "scraper_scrape_duration_seconds",
+                            loop.time() - start,
+                            self._SCRAPE_BUCKETS,
+                            source=scraper.SOURCE
+                        )
+            except Exception as e:
+                result.errors[scraper.SOURCE] = e
+            # Not when cancelled, nobody waits for it and the queue may be full
+            await articles.put(finished)
+
+        loop = asyncio.get_running_loop()
+        progress.start_process(len(scrapers), "Running Scrapers")
+        tasks = [asyncio.ensure_future(scrape(scraper)) for scraper in scrapers]
+        running = len(tasks)
+        batch: List[Article] = []
+        flush_at = 0.0
+        try:
+            while running:
+                timeout = max(0.0, flush_at - loop.time()) if batch else None
+                try:
+                    item = await asyncio.wait_for(articles.get(), timeout)
+                except asyncio.TimeoutError:
+                    item = None
+                if item is finished:
+                    running -= 1
+                    progress.update_process()
+                elif item is not None:
+                    if not batch:
+                        flush_at = loop.time() + self._max_batch_delay
+                    batch.append(item)  # type: ignore
+
+                if batch and (item is None or len(batch) >= self._batch_size or not running):
+                    self._store(batch)
+                    yield batch
+                    batch = []
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            progress.end_process()
+
+    def _astream_source(self, scraper: Scraper, parameters: Scraper.Parameters, progress: Progress) -> AsyncIterator[Article]:
+        if self._RESULT_CACHE is None:
+            return scraper.astream(parameters, progress)
+        return self._RESULT_CACHE.astream(scraper, parameters, progress)
+
+    @staticmethod
+    def _store(articles: List[Article]):
+        store = Scraper.article_store()
+        if store is not None:
+            store.add(articles)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from typing import AsyncIterator, Dict, List, Tuple
+from article import Article
+from metrics import METRICS
+from progress import Progress
+from scrapers.scraper import Scraper
+import asyncio
+import time
+
+
+class ScrapeResultCache:
+    """
+    Process-wide cache of the articles a source returned for a date range,
+    shared by all sessions. Identical scrapes running at the same time are
+    merged into one: the first caller scrapes, the others wait for its result.
+    """
+
+    @dataclass
+    class Parameters:
+        ttl: float = 60 * 60  # s
+        max_entries: int = 256
+        # s, then a waiting session stops waiting for a stalled scrape and scrapes itself
+        max_wait: float = 10 * 60
+
+    @dataclass
+    class _Entry:
+        articles: List[Article]
+        # no request failed, incomplete results are shared but not kept
+        complete: bool
+        stored_at: float
+
+    _Key = Tuple[str, datetime, datetime]
+
+    _parameters: Parameters
+    _entries: Dict[_Key, _Entry]
+    _flights: Dict[_Key, Future]
+    _lock: Lock
+
+    def __init__(self, parameters: Parameters | None = None):
+        self._parameters = parameters or self.Parameters()
+        self._entries = {}
+        self._flights = {}
+        self._lock = Lock()
+
+    async def astream(self, scraper: Scraper, parameters: Scraper.Parameters, progress: Progress) -> AsyncIterator[Article]:
+        """
+        `scraper.astream` through the cache. Without `since_last_run` cached
+        results are not used, but the scrape still refreshes the cache.
+        """
+        key = (scraper.SOURCE, parameters.start_date, parameters.end_date)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._is_fresh(entry):
+                del self._entries[key]
+                entry = None
+            if entry is not None and not parameters.since_last_run:
+                entry = None
+            flight = self._flights.get(key)
+            leader = entry is None and flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+
+        if entry is not None:
+            METRICS.increment("scrape_result_cache_hits_total", source=scraper.SOURCE)
+            for article in entry.articles:
+                yield article
+            return
+
+        assert flight is not None
+        if not leader:
+            METRICS.increment("scrape_result_cache_shared_total", source=scraper.SOURCE)
+            waiting = asyncio.wrap_future(flight)
+            try:
+                # Shielded, a cancelled session must not cancel the flight of the others
+                entry = await asyncio.wait_for(asyncio.shield(waiting), self._parameters.max_wait)
+            except asyncio.TimeoutError:
+                METRICS.increment("scrape_result_cache_stalled_total", source=scraper.SOURCE)
+                # Nobody awaits the flight anymore, its error must not be logged as unhandled
+                waiting.add_done_callback(lambda done: done.cancelled() or done.exception())
+                # Later sessions start a new flight instead of joining the stalled one
+                self._land(key, flight)
+                async for article in scraper.astream(parameters, progress):
+                    yield article
+                return
+            if not entry.complete:
+                progress.add_error_message(f"Fehler beim Scrapen der Quelle: {scraper.SOURCE}")
+            for article in entry.articles:
+                yield article
+            return
+
+        METRICS.increment("scrape_result_cache_misses_total", source=scraper.SOURCE)
+        failures = METRICS.counter("scraper_failed_requests_total", source=scraper.SOURCE)
+        articles = []
+        try:
+            async for article in scraper.astream(parameters, progress):
+                articles.append(article)
+                yield article
+        except BaseException as e:
+            # Also when the stream is closed or cancelled, waiting sessions must never wait forever
+            self._land(key, flight)
+            if not flight.done():
+                # Waiting sessions must not be cancelled along with this one
+                flight.set_exception(e if isinstance(e, Exception) else RuntimeError(f"Scrape of {scraper.SOURCE} was aborted"))
+            raise
+
+        entry = self._Entry(
+            articles,
+            METRICS.counter("scraper_failed_requests_total", source=scraper.SOURCE) == failures,
+            time.monotonic()
+        )
+        with self._lock:
+            # Landed and stored at once, a session starting in between would scrape again
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if entry.complete:
+                self._entries.pop(key, None)
+                self._entries[key] = entry
+                self._evict()
+        if not flight.done():
+            flight.set_result(entry)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _land(self, key: _Key, flight: Future):
+        with self._lock:
+            # A newer flight may have replaced a stalled one
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def _is_fresh(self, entry: _Entry) -> bool:
+        return time.monotonic() - entry.stored_at < self._parameters.ttl
+
+    def _evict(self):
+        for key in [key for key, entry in self._entries.items() if not self._is_fresh(entry)]:
+            del self._entries[key]
+        # Entries are inserted in order, so the first ones are the oldest
+        while len(self._entries) > self._parameters.max_entries:
+            del self._entries[next(iter(self._entries))]
@@ -1,21 +1,91 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-import requests
+from functools import partial
 from article import Article
-from typing import Dict, List
+from threading import Lock
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple, TypeVar
+from urllib.parse import urljoin, urlsplit
 from progress import Progress
+from scrapers.session_pool import SessionPool
+from scrapers.http_cache import HttpCache
+from scrapers.rate_limiter import RateLimiter
+from scrapers.retry_policy import RetryPolicy
+from scrapers.http_archive import ArchiveMode, HttpArchive
+from metrics import METRICS
+import requests
+from article_store import ArticleStore
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+import asyncio
+import multiprocessing
+import re
+import time
+
+
+T = TypeVar("T")
+D = TypeVar("D", Article, "Scraper.Entry")
+
+
+def _timed(function: Callable[..., T], *args: Any) -> Tuple[T, float]:
+    """Module level, so it can be sent to parse processes."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
 
 
 class Scraper(ABC):
 
     SOURCE: str
 
+    _SESSION_POOL: SessionPool = SessionPool()
+    _HTTP_CACHE: HttpCache | None = HttpCache()
+    _HTTP_ARCHIVE: HttpArchive = HttpArchive()
+    _ARTICLE_STORE: ArticleStore | None = ArticleStore()
+    # Blocking fetches and parses are awaited from the event loop on these
+    # shared pools, so one loop can keep requests of all sources in flight.
+    _FETCH_EXECUTOR: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=RetryPolicy.MAX_CALLERS, thread_name_prefix="scraper-fetch")
+    _PARSE_EXECUTOR: Executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="scraper-parse")
+    # One limiter per host, shared by every scraper talking to it
+    _RATE_LIMITERS: Dict[str, RateLimiter] = {}
+    _RATE_LIMITERS_LOCK: Lock = Lock()
+
+    _PARSER: str = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+    # End in a line break in `_content_to_markdown`
+    _BLOCK_TAGS: frozenset[str] = frozenset({"p", "div", "strong", "span", "abbr"})
+
+    # Listing pages fetched ahead of the one being looked at
+    _PAGE_WINDOW: int = 4
+    _MAX_PAGES: int = 100
+    _PAGE_LINK_STRAINER: SoupStrainer = SoupStrainer(["a", "base"], href=True)
+    # The page number in links like "?gtp=123_list%253D2" or "/page/2/"
+    _PAGE_NUMBER_PATTERN: re.Pattern = re.compile(r"(?:=|%3D|%253D|/)(2)(?=[/&#;]|$)", re.IGNORECASE)
+
     @dataclass
     class Parameters(ABC):
         start_date: datetime
         end_date: datetime
+        # serve articles scraped in earlier runs from the article store
+        since_last_run: bool = False
+
+    @dataclass
+    class Entry:
+        timestamp: datetime
+        title: str
+        link: str
+
+    _rate_limit: RateLimiter.Parameters
+    _retry_policy: RetryPolicy
+
+    def __init__(
+        self,
+        rate_limit: RateLimiter.Parameters | None = None,
+        retry: RetryPolicy.Parameters | None = None
+    ):
+        self._rate_limit = rate_limit or RateLimiter.Parameters()
+        self._retry_policy = RetryPolicy(retry or RetryPolicy.Parameters())
 
     def __init__subclass__(cls, **_) -> None:  # type: ignore
         super().__init_subclass__()
@@ -23,48 +93,423 @@ class Scraper(ABC):
         assert isinstance(parameters_class, type)
         assert issubclass(parameters_class, Scraper.Parameters)
 
-    def _get(self, url: str, progress: Progress, error_message: str, parameters: Dict[str, str] | None = None) -> str | None:
+    @classmethod
+    def configure_sessions(cls, parameters: SessionPool.Parameters):
+        cls._SESSION_POOL.configure(parameters)
+
+    @classmethod
+    def configure_cache(cls, parameters: HttpCache.Parameters | None):
+        """Use a cache with the given parameters, `None` disables caching."""
+        cls._HTTP_CACHE = HttpCache(parameters) if parameters is not None else None
+
+    @classmethod
+    def configure_archive(cls, parameters: HttpArchive.Parameters):
+        """
+        Record to or replay from a fixture archive instead of plain fetching.
+        Recording skips cache lookups, so every page is fetched in full and
+        recorded. Pages served by the HTTP cache never reach the archive, so
+        disable the cache for deterministic replays.
+        """
+        cls._HTTP_ARCHIVE = HttpArchive(parameters)
+
+    @classmethod
+    def configure_parsing(cls, processes: int | None):
+        """
+        Parse pages in `processes` worker processes instead of threads, so
+        parsing scales with cores and leaves the GIL to the app. Workers get
+        the scraper and the html and only send back the extracted records.
+        `None` parses on threads again.
+        """
+        previous = cls._PARSE_EXECUTOR
+        if processes is None:
+            cls._PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="scraper-parse")
+        else:
+            # Forking a process with running threads is unsafe
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            cls._PARSE_EXECUTOR = ProcessPoolExecutor(max_workers=processes, mp_context=context)
+        previous.shutdown(wait=False)
+
+    @classmethod
+    def configure_store(cls, filename: str | None):
+        """Use the article store in `filename`, `None` disables the store."""
+        cls._ARTICLE_STORE = ArticleStore(filename) if filename is not None else None
+
+    @classmethod
+    def article_store(cls) -> ArticleStore | None:
+        return cls._ARTICLE_STORE
+
+    def _get(self, url: str, progress: Progress, error_message: str, parameters: Dict[str, str] | None = None, immutable: bool = False) -> str | None:
+        start = time.monotonic()
         try:
-            response = requests.get(url, params=parameters)
-            response.raise_for_status()
-            html = response.text
+            html = self._fetch(url, parameters, immutable)
         except Exception:
+            METRICS.increment("scraper_failed_requests_total", source=self.SOURCE)
             progress.add_error_message(error_message)
             return None
+        finally:
+            # Including cache lookups, retries and backoff
+            METRICS.observe("scraper_fetch_duration_seconds", time.monotonic() - start, source=self.SOURCE)
+        return html
+
+    def _fetch(self, url: str, parameters: Dict[str, str] | None, immutable: bool) -> str:
+        """
+        Fetch through the HTTP cache: immutable pages (articles) are served
+        from disk while fresh, everything else is revalidated conditionally.
+        """
+        cache = self._HTTP_CACHE
+        # A revalidated page would be recorded as a 304 without a body
+        recording = self._HTTP_ARCHIVE.mode == ArchiveMode.RECORD
+        cached = cache.lookup(url, parameters) if cache is not None and not recording else None
+        if cached is not None and immutable and cache.is_fresh(cached):  # type: ignore
+            METRICS.increment("scraper_cache_hits_total", source=self.SOURCE, kind="fresh")
+            return cached.body
+
+        headers = cached.validators if cached is not None else None
+        response = self._retry_policy.call(
+            partial(self._request, url, parameters, headers),
+            on_retry=partial(METRICS.increment, "scraper_retries_total", source=self.SOURCE),
+            on_hedge=partial(METRICS.increment, "scraper_hedged_requests_total", source=self.SOURCE)
+        )
+        if response.status_code == 304 and cached is not None:
+            METRICS.increment("scraper_cache_hits_total", source=self.SOURCE, kind="revalidated")
+            cache.revalidated(url, parameters)  # type: ignore
+            return cached.body
+        response.raise_for_status()
+
+        html = response.text
+        if cache is not None:
+            cache.store(
+                url,
+                parameters,
+                html,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified")
+            )
         return html
 
+    def _request(self, url: str, parameters: Dict[str, str] | None, headers: Dict[str, str] | None, timeout: float) -> requests.Response:
+        """A single network request, paced by the host's rate limiter."""
+        if self._HTTP_ARCHIVE.mode == ArchiveMode.REPLAY:
+            start = time.monotonic()
+            response = self._HTTP_ARCHIVE.replay(url, parameters)
+            self._observe_response(time.monotonic() - start, response)
+            return response
+
+        limiter = self._rate_limiter(url)
+        limiter.acquire()
+        start = time.monotonic()
+        response, status, retry_after = None, None, None
+        try:
+            response = self._SESSION_POOL.get(url, params=parameters, headers=headers, timeout=timeout)
+            status, retry_after = response.status_code, response.headers.get("Retry-After")
+        finally:
+            latency = time.monotonic() - start
+            limiter.release(latency, status, retry_after)
+            self._observe_response(latency, response)
+        if self._HTTP_ARCHIVE.mode == ArchiveMode.RECORD:
+            self._HTTP_ARCHIVE.record(url, parameters, response)
+        return response
+
+    def _observe_response(self, latency: float, response: requests.Response | None):
+        """`response` is `None` if the request failed without one."""
+        METRICS.observe("scraper_request_duration_seconds", latency, source=self.SOURCE)
+        status = str(response.status_code) if response is not None else "error"
+        METRICS.increment("scraper_responses_total", source=self.SOURCE, status=status)
+        if response is not None:
+            # Decoded size, the transfer itself is usually compressed
+            METRICS.increment("scraper_response_bytes_total", len(response.content), source=self.SOURCE)
+
+    def _rate_limiter(self, url: str) -> RateLimiter:
+        host = urlsplit(url).netloc
+        with self._RATE_LIMITERS_LOCK:
+            limiter = self._RATE_LIMITERS.get(host)
+            if limiter is None:
+                limiter = self._RATE_LIMITERS[host] = RateLimiter(self._rate_limit)
+            return limiter
+
+    async def _aget(self, url: str, progress: Progress, error_message: str, parameters: Dict[str, str] | None = None, immutable: bool = False) -> str | None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._FETCH_EXECUTOR,
+            partial(self._get, url, progress, error_message, parameters, immutable)
+        )
+
+    async def _aparse(self, function: Callable[..., T], *args: Any) -> T:
+        """Run a parse function off the event loop."""
+        loop = asyncio.get_running_loop()
+        # Recorded here, the metrics of a parse process are never reported
+        result, duration = await loop.run_in_executor(self._PARSE_EXECUTOR, partial(_timed, function, *args))
+        METRICS.observe("scraper_parse_duration_seconds", duration, source=self.SOURCE)
+        return result
+
+    async def _astream_articles(
+        self,
+        entries: List[Scraper.Entry],
+        parameters: Scraper.Parameters,
+        progress: Progress,
+        desc: str
+    ) -> AsyncIterator[Article]:
+        """
+        Fetch and parse the detail page of every entry inside the date range
+        and yield each article as soon as it is ready. Articles that could not
+        be fetched are skipped, their error message is reported. With
+        `since_last_run` only links missing from the article store are fetched.
+        """
+        entries = self._filter_dates(entries, parameters)
+
+        known = {}
+        if parameters.since_last_run and self._ARTICLE_STORE is not None:
+            known = self._ARTICLE_STORE.lookup(self.SOURCE, [entry.link for entry in entries])
+        for article in known.values():
+            yield article
+
+        new_entries = [entry for entry in entries if entry.link not in known]
+        # The host's rate limiter decides how many of these actually run
+        semaphore = asyncio.Semaphore(self._rate_limit.max_concurrency)
+
+        async def scrape(entry: Scraper.Entry) -> Article | None:
+            async with semaphore:
+                html = await self._aget(
+                    entry.link,
+                    progress,
+                    f"Fehler beim Scrapen der Quelle: {self.SOURCE} bei Artikel: {entry.title}",
+                    immutable=True
+                )
+            if html is None:
+                return None
+            return await self._aparse(self._parse_article, html, entry)
+
+        progress.start_process(len(new_entries), desc)
+        tasks = [asyncio.ensure_future(scrape(entry)) for entry in new_entries]
+        try:
+            for next_article in asyncio.as_completed(tasks):
+                article = await next_article
+                progress.update_process()
+                if article is not None:
+                    yield article
+        finally:
+            for task in tasks:
+                task.cancel()
+            progress.end_process()
+
+    async def _alisting(
+        self,
+        url: str,
+        parse: Callable[[str], List[D] | None],
+        start_date: datetime,
+        progress: Progress,
+        error_message: str
+    ) -> List[D] | None:
+        """
+        Fetch and parse a listing with all its pages. Further pages are found
+        via the listing's link to page 2. `None` if the first page failed.
+        """
+        html = await self._aget(url, progress, error_message)
+        if html is None:
+            return None
+
+        items = await self._aparse(parse, html) or []
+        # Newest first, once a page reaches back past `start_date` later pages are older still
+        if not items or any(item.timestamp < start_date for item in items):
+            return items
+        page_link = await self._aparse(self._page_link, html, url)
+        if page_link is None:
+            return items
+        before, after = page_link
+
+        return items + await self._apaginate(
+            lambda page: (f"{before}{page}{after}", None),
+            parse,
+            start_date,
+            progress,
+            error_message,
+            first_page=2,
+            seen={item.link for item in items}
+        )
+
+    async def _apaginate(
+        self,
+        page_request: Callable[[int], Tuple[str, Dict[str, str] | None]],
+        parse: Callable[[str], List[D] | None],
+        start_date: datetime,
+        progress: Progress,
+        error_message: str,
+        first_page: int = 0,
+        seen: set[str] | None = None
+    ) -> List[D]:
+        """
+        Page through a listing sorted newest first, with `_PAGE_WINDOW` pages
+        fetched and parsed speculatively ahead. Stops at the first failed,
+        empty or repeated page and after the first page reaching back past
+        `start_date`. Pages fetched past the end are dropped silently.
+        """
+        loop = asyncio.get_running_loop()
+        seen = set(seen or ())
+
+        async def fetch(page: int) -> List[D] | None:
+            url, parameters = page_request(page)
+            html = await loop.run_in_executor(
+                self._FETCH_EXECUTOR,
+                partial(self._fetch, url, parameters, False)
+            )
+            return await self._aparse(parse, html)
+
+        last_page = first_page + self._MAX_PAGES
+        tasks: Dict[int, asyncio.Future] = {}
+        next_page = first_page
+        items: List[D] = []
+        try:
+            for page in range(first_page, last_page):
+                while next_page < min(page + self._PAGE_WINDOW, last_page):
+                    tasks[next_page] = asyncio.ensure_future(fetch(next_page))
+                    next_page += 1
+
+                try:
+                    page_items = await tasks.pop(page)
+                except Exception:
+                    METRICS.increment("scraper_failed_requests_total", source=self.SOURCE)
+                    progress.add_error_message(error_message)
+                    break
+
+                # Out of range pages are empty or repeat the last page
+                new_items = [item for item in page_items or [] if item.link not in seen]
+                if not new_items:
+                    break
+                items.extend(new_items)
+                seen.update(item.link for item in new_items)
+
+                if any(item.timestamp < start_date for item in new_items):
+                    break
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        return items
+
+    @classmethod
+    def _page_link(cls, html: str, url: str) -> Tuple[str, str] | None:
+        """The listing's link to page 2, split around the page number."""
+        soup = BeautifulSoup(html, cls._PARSER, parse_only=cls._PAGE_LINK_STRAINER)
+        base = soup.find("base")
+        base_url = urljoin(url, str(base["href"])) if base is not None else url
+
+        for a in soup.find_all("a"):
+            if a.get_text(strip=True) != "2":
+                continue
+            href = urljoin(base_url, str(a["href"]))
+            matches = list(cls._PAGE_NUMBER_PATTERN.finditer(href))
+            if not matches:
+                continue
+            start, end = matches[-1].span(1)
+            return href[:start], href[end:]
+        return None
+
+    @staticmethod
+    def _strainer(names: List[str], classes: List[str]) -> SoupStrainer:
+        """Keep tags named `names` that carry any of the css `classes`."""
+        wanted = set(classes)
+
+        def has_class(value: str | List[str] | None) -> bool:
+            # While parsing, "class" is still the raw attribute string
+            if value is None:
+                return False
+            values = value.split() if isinstance(value, str) else value
+            return not wanted.isdisjoint(values)
+
+        return SoupStrainer(names, attrs={"class": has_class})
+
+    def _soup(self, html: str, strainer: SoupStrainer | None = None) -> BeautifulSoup:
+        return BeautifulSoup(html, self._PARSER, parse_only=strainer)
+
+    def _parse_article(self, html: str, entry: Scraper.Entry) -> Article:
+        raise NotImplementedError(f"{type(self).__name__} has no detail pages")
+
     def _filter_dates(
         self, 
-        articles: List[Article], 
+        articles: List[D], 
         parameters: Scraper.Parameters
-    ) -> List[Article]:
+    ) -> List[D]:
+        """Keep the articles (or listing entries) inside the date range."""
         return [
             a for a in articles
             if parameters.start_date <= a.timestamp <= parameters.end_date
         ]
     
-    def _content_to_markdown(self, content) -> str:
-        text_parts = []
+    def _content_to_markdown(self, content, first_paragraph: bool = False) -> str:
+        """
+        Links become markdown links, block tags end in a line break. Walks the
+        tree with an explicit stack, only block tags get their own buffer.
+        With `first_paragraph` only the first line of the stripped text is
+        returned and the walk stops as soon as that line is complete.
+        """
+        parts: List[str] = []  # output of the innermost open block tag
+        # Iterators of the open tags' children, with the output of the
+        # enclosing block for block tags
+        stack: List[Tuple[Any, List[str] | None]] = []
+        children = iter(content.contents)
+        block_tags = self._BLOCK_TAGS
+        has_text = False
+
+        while True:
+            for child in children:
+                name = child.name
+                if name is None:  # NavigableString
+                    parts.append(child)
+                    if not has_text and child and not child.isspace():
+                        has_text = True
 
-        for child in content.children:
-            if child.name == "a":
-                label = child.get_text(strip=True)
-                href = child.get("href", "")
-                text_parts.append(f"[{label}]({href})")
+                elif name == "a":
+                    label = child.get_text(strip=True)
+                    href = child.get("href", "")
+                    parts.append(f"[{label}]({href})")
+                    has_text = True
 
-            elif child.name in ("p", "div", "strong", "span", "abbr"):
-                text_parts.append(self._content_to_markdown(child).strip() + "\n")
+                elif name in block_tags:
+                    stack.append((children, parts))
+                    parts = []
+                    children = iter(child.contents)
+                    break
 
-            elif child.name is None:  # NavigableString
-                text_parts.append(child)
+                else:
+                    # any other tag (e.g., <i>) is walked inline
+                    stack.append((children, None))
+                    children = iter(child.contents)
+                    break
 
             else:
-                # recursively process any other tag (e.g., <i>)
-                text_parts.append(self._content_to_markdown(child))
+                if not stack:
+                    break
+                children, outer = stack.pop()
+                if outer is not None:
+                    outer.append("".join(parts).strip() + "\n")
+                    parts = outer
+                    # A line break after text: the first line is complete
+                    if first_paragraph and has_text:
+                        return self._first_line(parts, stack)
 
-        return "".join(text_parts)
+        if first_paragraph:
+            return self._first_line(parts, stack)
+        return "".join(parts)
+
+    @staticmethod
+    def _first_line(parts: List[str], stack: List[Tuple[Any, List[str] | None]]) -> str:
+        # Close the still open block tags as if their content ended here
+        for _, outer in reversed(stack):
+            if outer is not None:
+                outer.append("".join(parts).strip() + "\n")
+                parts = outer
+        return "".join(parts).strip().split("\n")[0]
 
 
-    @abstractmethod
     def scrape(self, parameters: Scraper.Parameters, progress: Progress) -> List[Article]:
+        return asyncio.run(self.ascrape(parameters, progress))
+
+    async def ascrape(self, parameters: Scraper.Parameters, progress: Progress) -> List[Article]:
+        return [article async for article in self.astream(parameters, progress)]
+
+    @abstractmethod
+    def astream(self, parameters: Scraper.Parameters, progress: Progress) -> AsyncIterator[Article]:
+        """Yield the source's articles in the date range as they are scraped."""
         raise NotImplementedError("@abstractmethod")
@@ -0,0 +1,104 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Callable, List, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+import re
+
+
+GERMAN_MONTHS: List[str] = [
+    "",
+    "Januar",
+    "Februar",
+    "März",
+    "April",
+    "Mai",
+    "Juni",
+    "Juli",
+    "August",
+    "September",
+    "Oktober",
+    "November",
+    "Dezember"
+]
+
+_ISO_DATE: re.Pattern = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_NUMERIC_DATE: re.Pattern = re.compile(r"(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})")
+_GERMAN_DATE: re.Pattern = re.compile(r"(\d{1,2})\.?\s*(" + "|".join(GERMAN_MONTHS[1:]) + r")\s+(\d{4})")
+
+
+def parse_date(text: str) -> datetime:
+    """The first date in `text`: "2025-01-31", "31.01.2025" or "31. Januar 2025"."""
+    matches = [match for pattern in (_ISO_DATE, _NUMERIC_DATE, _GERMAN_DATE) if (match := pattern.search(text))]
+    if not matches:
+        raise ValueError(f"No date in {text!r}")
+    match = min(matches, key=lambda match: match.start())
+    if match.re is _ISO_DATE:
+        year, month, day = (int(x) for x in match.groups())
+    elif match.re is _NUMERIC_DATE:
+        day, month, year = (int(x) for x in match.groups())
+    else:
+        day, month, year = int(match[1]), GERMAN_MONTHS.index(match[2]), int(match[3])
+    return datetime(year=year, month=month, day=day)
+
+
+class Axis(Enum):
+    DESCENDANT = "descendant"
+    # In document order, like `Tag.find_previous`/`Tag.find_next`
+    PREVIOUS = "previous"
+    NEXT = "next"
+
+
+@dataclass(frozen=True)
+class FieldRule:
+    """Where one value of a listing item (or article page) is found."""
+    selector: str | None = None  # css, `None` is the item itself
+    attribute: str | None = None  # `None` is the text
+    pattern: str | None = None  # regex, its first group is the value
+    prefix: str = ""  # e.g. for relative links
+    axis: Axis = Axis.DESCENDANT
+    markdown: bool = False
+
+
+@dataclass(frozen=True)
+class ListingRule:
+    """The items of a listing page and their fields."""
+    # css selector, or a hook for listings css cannot describe
+    items: str | Callable[[BeautifulSoup], List[Tag]]
+    date: FieldRule
+    title: FieldRule
+    link: FieldRule
+    # Sources without detail pages take the content from the listing
+    content: FieldRule | None = None
+    skip_first: int = 0
+    skip_last: int = 0
+    # Items whose (selector) text is one of the (lowercase) texts are dropped
+    exclude: Tuple[str, Tuple[str, ...]] | None = None
+    strainer: SoupStrainer | None = None
+    # Follow the listing's page links, see `Scraper._alisting`
+    paginate: bool = False
+
+
+@dataclass(frozen=True)
+class ArticleRule:
+    """Which paragraphs of a detail page make up the content."""
+    paragraphs: str  # css
+    count: int = 1  # joined by blank lines
+    offset: int = 0
+    non_empty: bool = False
+    markdown: bool = False
+    first_line: bool = False
+    # `None` is the source
+    medium_organisation: FieldRule | None = None
+    strainer: SoupStrainer | None = None
+
+
+@dataclass(frozen=True)
+class ScraperSpec:
+    source: str
+    url: str
+    listing: ListingRule
+    # `None` for sources whose listing already holds the content
+    article: ArticleRule | None = None
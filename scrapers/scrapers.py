@@ -1,4 +1,5 @@
 from scrapers.scraper import Scraper
+from scrapers.rate_limiter import RateLimiter
 from typing import Dict
 from scrapers.hib_scraper import HibScraper
 from scrapers.nkr_scraper import NkrScraper
@@ -15,7 +16,7 @@ from scrapers.bmas_scraper import BmasScraper
 
 
 ALL_SCRAPERS: Dict[str, Scraper] = {
-    "Heute im Bundestag": HibScraper(),
+    "Heute im Bundestag": HibScraper(RateLimiter.Parameters(rate=5.0, burst=5, max_concurrency=8)),
     "Normenkontrollrat": NkrScraper(),
     "BfDI": BfdiScraper(),
     "BVA": BvaScraper(),
@@ -0,0 +1,81 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Mapping
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+class SessionPool:
+    """Keep-alive `requests.Session`s, one per host, shared by all scrapers."""
+
+    @dataclass
+    class Parameters:
+        pool_size: int = 16
+        connect_timeout: float = 5.0  # s
+        read_timeout: float = 30.0  # s
+
+    # urllib3 only advertises "br"/"zstd" if it can decode them
+    _HEADERS: Mapping[str, str] = {
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive"
+    }
+
+    _parameters: Parameters
+    _sessions: Dict[str, requests.Session]
+    _lock: Lock
+
+    def __init__(self, parameters: Parameters | None = None):
+        self._parameters = parameters or self.Parameters()
+        self._sessions = {}
+        self._lock = Lock()
+
+    @property
+    def parameters(self) -> Parameters:
+        return self._parameters
+
+    def configure(self, parameters: Parameters):
+        with self._lock:
+            self._parameters = parameters
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+        for session in sessions:
+            session.close()
+
+    def session(self, url: str) -> requests.Session:
+        host = urlsplit(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._sessions[host] = self._create_session()
+            return session
+
+    def get(self, url: str, params: Mapping[str, str] | None = None, headers: Mapping[str, str] | None = None, timeout: float | None = None) -> requests.Response:
+        """`timeout` can shorten the configured timeouts, e.g. to meet a deadline."""
+        connect_timeout = self._parameters.connect_timeout
+        read_timeout = self._parameters.read_timeout
+        if timeout is not None:
+            connect_timeout = min(connect_timeout, timeout)
+            read_timeout = min(read_timeout, timeout)
+        return self.session(url).get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=(connect_timeout, read_timeout)
+        )
+
+    def close(self):
+        self.configure(self._parameters)
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self._parameters.pool_size
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self._HEADERS)
+        return session
@@ -0,0 +1,159 @@
+from __future__ import annotations
+from typing import AsyncIterator, List
+from article import Article
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+from progress import Progress
+from scrapers.scraper import Scraper
+from scrapers.scraper_spec import Axis, FieldRule, ListingRule, ScraperSpec, parse_date
+import re
+
+
+class SpecScraper(Scraper):
+    """
+    Runs a declarative `ScraperSpec`: listing, optional pagination, optional
+    detail pages and the date cutoff are implemented here once for every
+    source. Subclasses only provide the `SPEC` and hooks for real quirks.
+    """
+
+    SPEC: ScraperSpec
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.SOURCE = cls.SPEC.source
+
+    async def astream(self, parameters: Scraper.Parameters, progress: Progress) -> AsyncIterator[Article]:
+        items = await self._aitems(parameters, progress)
+        if items is None:
+            return
+
+        if self.SPEC.article is None:
+            for article in self._filter_dates(items, parameters):
+                yield article
+            return
+
+        async for article in self._astream_articles(items, parameters, progress, f"Scraping {self.SOURCE} articles..."):
+            yield article
+
+    async def _aitems(self, parameters: Scraper.Parameters, progress: Progress) -> List | None:
+        """All listing items (entries or articles), `None` if the listing failed."""
+        error_message = f"Fehler beim Scrapen der Quelle: {self.SOURCE}"
+        if self.SPEC.listing.paginate:
+            return await self._alisting(self.SPEC.url, self._parse_listing, parameters.start_date, progress, error_message)
+
+        html = await self._aget(self.SPEC.url, progress, error_message)
+        if html is None:
+            return None
+        return await self._aparse(self._parse_listing, html)
+
+    def _parse_listing(self, html: str) -> List:
+        listing = self.SPEC.listing
+        soup = self._soup(html, listing.strainer)
+
+        if isinstance(listing.items, str):
+            tags = soup.select(listing.items)
+        else:
+            tags = listing.items(soup)
+        tags = tags[listing.skip_first:len(tags) - listing.skip_last]
+
+        items = []
+        for tag in tags:
+            if self._is_excluded(tag, listing):
+                continue
+
+            timestamp = parse_date(self._field(tag, listing.date))
+            title = self._field(tag, listing.title).replace("\n", "")
+            link = self._field(tag, listing.link)
+
+            if listing.content is None:
+                items.append(Scraper.Entry(timestamp, title, link))
+            else:
+                items.append(Article(
+                    timestamp=timestamp,
+                    title=title,
+                    medium_organisation=self.SOURCE,
+                    content=self._field(tag, listing.content),
+                    link=link,
+                    source=self.SOURCE
+                ))
+
+        return items
+
+    def _parse_article(self, html: str, entry: Scraper.Entry) -> Article:
+        rule = self.SPEC.article
+        assert rule is not None
+        soup = self._soup(html, rule.strainer)
+
+        paragraphs = []
+        for p in soup.select(rule.paragraphs):
+            text = self._text(p, rule.markdown, rule.first_line)
+            if rule.non_empty and not text:
+                continue
+            paragraphs.append(text)
+            # Later paragraphs are never used
+            if len(paragraphs) == rule.offset + rule.count:
+                break
+        assert len(paragraphs) > rule.offset, f"{self.SOURCE}: no content in {rule.paragraphs!r} of {entry.link}"
+
+        content = "\n\n".join(paragraphs[rule.offset:])
+        if rule.first_line:
+            content = content.split("\n")[0]
+
+        medium_organisation = self.SOURCE
+        if rule.medium_organisation is not None:
+            medium_organisation = self._field(soup, rule.medium_organisation)
+
+        return Article(
+            timestamp=entry.timestamp,
+            title=entry.title,
+            medium_organisation=medium_organisation,
+            content=content,
+            link=entry.link,
+            source=self.SOURCE
+        )
+
+    def _field(self, tag: Tag | BeautifulSoup, rule: FieldRule) -> str:
+        found = self._select(tag, rule)
+        assert found is not None, f"{self.SOURCE}: no match for {rule.selector!r}"
+
+        if rule.attribute is not None:
+            assert found.has_attr(rule.attribute), f"{self.SOURCE}: {rule.selector!r} has no {rule.attribute!r}"
+            value = str(found[rule.attribute])
+        else:
+            value = self._text(found, rule.markdown)
+
+        if rule.pattern is not None:
+            match = re.search(rule.pattern, value)
+            assert match, f"{self.SOURCE}: {value!r} does not match {rule.pattern!r}"
+            value = match[1]
+
+        return rule.prefix + value.strip()
+
+    @staticmethod
+    def _select(tag: Tag | BeautifulSoup, rule: FieldRule) -> Tag | None:
+        if rule.selector is None:
+            return tag  # type: ignore
+        if rule.axis == Axis.DESCENDANT:
+            return tag.select_one(rule.selector)
+
+        selector = rule.selector
+
+        def matches(candidate: Tag) -> bool:
+            return candidate.css.match(selector)
+
+        if rule.axis == Axis.PREVIOUS:
+            return tag.find_previous(matches)  # type: ignore
+        return tag.find_next(matches)  # type: ignore
+
+    def _text(self, tag: Tag, markdown: bool, first_line: bool = False) -> str:
+        if markdown:
+            return self._content_to_markdown(tag, first_paragraph=first_line).strip()
+        return tag.get_text().strip()
+
+    @staticmethod
+    def _is_excluded(tag: Tag, listing: ListingRule) -> bool:
+        if listing.exclude is None:
+            return False
+        selector, texts = listing.exclude
+        found = tag.select_one(selector)
+        return found is not None and found.get_text().strip().lower() in texts
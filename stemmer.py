@@ -1,23 +1,138 @@
-from typing import List
-from string import ascii_lowercase, ascii_uppercase
+from __future__ import annotations
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Tuple
 from nltk.stem import SnowballStemmer
+from metrics import METRICS
+import json
+import os
+import re
+import tempfile
+
+
+class StemCache:
+    """
+    Bounded token -> stem cache, saved to a JSON file so later runs and other
+    processes start warm. When full, the oldest entries go first.
+    """
+
+    @dataclass
+    class Parameters:
+        filename: str | None = ".cache/stems.json"  # `None` keeps it in memory
+        max_entries: int = 200_000
+
+    _parameters: Parameters
+    _stems: Dict[str, str]
+    _language: str
+    _lock: Lock
+
+    def __init__(self, language: str, parameters: Parameters | None = None):
+        self._parameters = parameters or self.Parameters()
+        self._language = language
+        self._stems = self._load()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._stems)
+
+    def get(self, token: str) -> str | None:
+        return self._stems.get(token)
+
+    def put(self, token: str, stem: str):
+        with self._lock:
+            if len(self._stems) >= self._parameters.max_entries:
+                del self._stems[next(iter(self._stems))]
+            self._stems[token] = stem
+
+    def save(self):
+        """
+        Merge into the file, other processes may have saved in the meantime.
+        Saves of two processes at the same moment can drop each other's new
+        stems, but never leave a broken file.
+        """
+        if self._parameters.filename is None:
+            return
+        directory = os.path.dirname(self._parameters.filename) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        with self._lock:
+            stems = self._load()
+            stems.update(self._stems)
+            stems = dict(list(stems.items())[-self._parameters.max_entries:])
+            # A temporary file per writer, replaced atomically: other processes saving at the
+            # same time never write into it, readers never see half a file
+            file = tempfile.NamedTemporaryFile('w', encoding="utf-8", dir=directory, suffix=".tmp", delete=False)
+            try:
+                with file:
+                    json.dump({"language": self._language, "stems": stems}, file, ensure_ascii=False)
+                os.replace(file.name, self._parameters.filename)
+            except BaseException:
+                os.remove(file.name)
+                raise
+
+    def _load(self) -> Dict[str, str]:
+        if self._parameters.filename is None:
+            return {}
+        try:
+            with open(self._parameters.filename, 'r', encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if data.get("language") != self._language:
+            return {}
+        stems = data.get("stems", {})
+        return dict(list(stems.items())[-self._parameters.max_entries:])
 
 
 class Stemmer:
 
     _LANGUAGE: str = "german"
     _STEMMER: SnowballStemmer = SnowballStemmer(_LANGUAGE)
+    # Press releases repeat a small vocabulary, most tokens were stemmed before
+    _CACHE: StemCache = StemCache(_LANGUAGE)
+    # Letters and digits of any script, hyphenated compounds stay one token
+    _TOKEN_PATTERN: re.Pattern = re.compile(r"[^\W_]+(?:-[^\W_]+)*")
+
+    @classmethod
+    def configure_cache(cls, parameters: StemCache.Parameters | None):
+        """Use a stem cache with `parameters`, `None` keeps only this run's stems."""
+        cls._CACHE = StemCache(cls._LANGUAGE, parameters or StemCache.Parameters(filename=None))
+
+    @classmethod
+    def save_cache(cls):
+        cls._CACHE.save()
+
+    @classmethod
+    def word_tokenize(cls, text: str) -> List[str]:
+        """Lowercase tokens, "Länder-Finanzausgleich 2025" is ["länder-finanzausgleich", "2025"]."""
+        lower_text = text.lower()
+        if len(lower_text) == len(text):
+            return cls._TOKEN_PATTERN.findall(lower_text)
+        # Some chars lower to several, the tokens must stay those of `word_offsets`
+        return [token.lower() for token in cls._TOKEN_PATTERN.findall(text)]
+
+    @classmethod
+    def word_offsets(cls, text: str) -> List[Tuple[int, int]]:
+        """(start, end) in `text` of each token of `word_tokenize`."""
+        return [match.span() for match in cls._TOKEN_PATTERN.finditer(text)]
+
+    @classmethod
+    def stem_tokens(cls, tokens: List[str]) -> List[str]:
+        cache = cls._CACHE
+        stems = []
+        misses = 0
+        for token in tokens:
+            stem = cache.get(token)
+            if stem is None:
+                misses += 1
+                stem = cls._STEMMER.stem(token).lower()
+                cache.put(token, stem)
+            stems.append(stem)
+        # Once per call, the hit path must stay a dict lookup
+        METRICS.increment("stemmer_cache_hits_total", len(tokens) - misses)
+        METRICS.increment("stemmer_cache_misses_total", misses)
+        return stems
 
-    @staticmethod
-    def word_tokenize(text: str) -> List[str]:
-        valid_characters = ascii_lowercase + ascii_uppercase + "- "
-        text = "".join(c for c in text if c in valid_characters).lower()
-        return text.split(" ")
-    
     @classmethod
     def stem(cls, text: str) -> str:
-        return " ".join(
-            cls._STEMMER.stem(token).lower()
-            for token in cls.word_tokenize(text)
-        )
-    
\ No newline at end of file
+        return " ".join(cls.stem_tokens(cls.word_tokenize(text)))